@@ -6,50 +6,116 @@ Main application entry point for the AI microservice
 
 import os
 import sys
+import time
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, abort, stream_with_context
 from flask_cors import CORS
+from flask_caching import Cache
+import fastjsonschema
+from fastjsonschema import JsonSchemaException
 import redis
+import httpx
 import openai
+import orjson
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
 # Import custom modules
-from services.content_analyzer import ContentAnalyzer
+from services.content_analyzer import ContentAnalyzer, OPENAI_TIMEOUT
 from services.quality_scorer import QualityScorer
 from services.fraud_detector import FraudDetector
 from utils.logger import setup_logger
 from utils.cache import CacheManager
+from utils.json_provider import ORJSONProvider
 from config import Config
 
 # Initialize Flask app
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 app.config.from_object(Config)
-CORS(app, origins=[os.getenv('CORS_ORIGIN', 'http://localhost:3000')])
+# Let browsers cache preflight responses so repeat calls skip the extra OPTIONS round-trip
+CORS(
+    app,
+    origins=[os.getenv('CORS_ORIGIN', 'http://localhost:3000')],
+    methods=['GET', 'POST'],
+    max_age=int(os.getenv('CORS_MAX_AGE', '86400'))
+)
+cache = Cache(app)
+
+def _is_ok_response(rv) -> bool:
+    """Response filter for cached views: only 200 responses are cached, so errors aren't replayed"""
+    return (rv[1] if isinstance(rv, tuple) else rv.status_code) == 200
 
 # Setup logging
 logger = setup_logger(__name__)
 
+# Shared OpenAI client over a pooled HTTP/2 connection, reused by every service
+_http_client = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    timeout=OPENAI_TIMEOUT
+)
+openai_client = openai.OpenAI(
+    api_key=os.getenv('OPENAI_API_KEY', 'demo-key-for-hackathon'),
+    http_client=_http_client,
+    timeout=OPENAI_TIMEOUT,
+    max_retries=0  # ContentAnalyzer retries with its own backoff; don't compound attempts
+)
+
 # Initialize services
-content_analyzer = ContentAnalyzer()
+content_analyzer = ContentAnalyzer(openai_client=openai_client)
 quality_scorer = QualityScorer()
 fraud_detector = FraudDetector()
 cache_manager = CacheManager()
 
-# Configure OpenAI
-openai.api_key = os.getenv('OPENAI_API_KEY')
+# Shared pool for batch feature extraction; extraction is dominated by OpenAI I/O,
+# so threads overlap the network round-trips of the items in a batch
+_batch_executor = ThreadPoolExecutor(max_workers=int(os.getenv('BATCH_ANALYSIS_WORKERS', '16')))
+
+# Request payload schema, compiled once at import into a specialized validator
+_REQUIRED_ANALYZE = frozenset({'content_id', 'content_type', 'content_url'})
+_ANALYZE_SCHEMA = {
+    'type': 'object',
+    'required': ['content_id', 'content_type', 'content_url'],
+    'properties': {
+        'content_id': {'type': ['string', 'integer']},
+        'content_type': {'type': 'string'},
+        'content_url': {'type': 'string'},
+        'metadata': {'type': 'object'}
+    }
+}
+_validate_analyze = fastjsonschema.compile(_ANALYZE_SCHEMA)
+
+# Second-granularity ISO timestamp, swapped atomically as a (second, iso_string) tuple
+_iso_cache = (0, '')
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO string, formatted at most once per second"""
+    global _iso_cache
+    now = int(time.time())
+    if now != _iso_cache[0]:
+        _iso_cache = (now, datetime.utcfromtimestamp(now).isoformat())
+    return _iso_cache[1]
+
+@app.before_request
+def reject_oversized_payloads():
+    """Reject bodies over MAX_CONTENT_LENGTH from the Content-Length header, before any parsing"""
+    if (request.content_length or 0) > app.config['MAX_CONTENT_LENGTH']:
+        abort(413)
 
 @app.route('/health', methods=['GET'])
+@cache.cached(timeout=5)
 def health_check():
     """Health check endpoint"""
     return jsonify({
         'status': 'healthy',
         'service': 'CreatorCoin AI Service',
         'version': '1.0.0',
-        'timestamp': datetime.utcnow().isoformat(),
+        'timestamp': _now_iso(),
         'uptime': app.config.get('START_TIME', datetime.utcnow()).isoformat()
     }), 200
 
@@ -72,16 +138,24 @@ def analyze_content():
         }
     }
     """
+    now_iso = _now_iso()
     try:
-        data = request.get_json()
+        data = orjson.loads(request.get_data())
         
         # Validate required fields
-        required_fields = ['content_id', 'content_type', 'content_url']
-        if not all(field in data for field in required_fields):
+        try:
+            _validate_analyze(data)
+        except JsonSchemaException as e:
+            missing = _REQUIRED_ANALYZE - data.keys() if isinstance(data, dict) else _REQUIRED_ANALYZE
+            if missing:
+                return jsonify({
+                    'error': 'Missing required fields',
+                    'required': _ANALYZE_SCHEMA['required'],
+                    'missing': sorted(missing)
+                }), 400
             return jsonify({
-                'error': 'Missing required fields',
-                'required': required_fields,
-                'received': list(data.keys())
+                'error': e.message,
+                'required': _ANALYZE_SCHEMA['required']
             }), 400
 
         content_id = data['content_id']
@@ -89,11 +163,11 @@ def analyze_content():
         # Check cache first
         cached_result = cache_manager.get_analysis(content_id)
         if cached_result:
-            logger.info(f"Returning cached analysis for content {content_id}")
+            logger.info("Returning cached analysis for content %s", content_id)
             return jsonify(cached_result), 200
 
         # Perform content analysis
-        logger.info(f"Starting analysis for content {content_id}")
+        logger.info("Starting analysis for content %s", content_id)
         
         # Extract content features
         features = content_analyzer.extract_features(data)
@@ -122,23 +196,23 @@ def analyze_content():
                 'action': fraud_score.get('action', 'allow')
             },
             'recommendations': quality_scores.get('recommendations', []),
-            'analysis_timestamp': datetime.utcnow().isoformat(),
+            'analysis_timestamp': now_iso,
             'processing_time_ms': features.get('processing_time', 0)
         }
 
         # Cache the result
         cache_manager.set_analysis(content_id, assessment)
         
-        logger.info(f"Analysis completed for content {content_id} with quality index {assessment['quality_index']}")
+        logger.info("Analysis completed for content %s with quality index %s", content_id, assessment['quality_index'])
         
         return jsonify(assessment), 200
 
     except Exception as e:
-        logger.error(f"Error analyzing content: {str(e)}")
+        logger.error("Error analyzing content: %s", e)
         return jsonify({
             'error': 'Internal server error',
             'message': str(e),
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': now_iso
         }), 500
 
 @app.route('/api/analyze/batch', methods=['POST'])
@@ -154,9 +228,20 @@ def analyze_batch():
             ...
         ]
     }
+    
+    Clients sending "Accept: application/x-ndjson" receive one JSON line per
+    item, tagged with its "index", in completion order instead of a single body.
     """
+    now_iso = _now_iso()
     try:
-        data = request.get_json()
+        # Reject oversized batches before reading or parsing the body
+        if (request.content_length or 0) > Config.MAX_BATCH_PAYLOAD_SIZE:
+            return jsonify({
+                'error': 'Batch payload too large',
+                'max_bytes': Config.MAX_BATCH_PAYLOAD_SIZE
+            }), 413
+        
+        data = orjson.loads(request.get_data())
         contents = data.get('contents', [])
         
         if not contents:
@@ -165,56 +250,139 @@ def analyze_batch():
         if len(contents) > 50:  # Limit batch size
             return jsonify({'error': 'Batch size too large (max 50)'}), 400
         
-        results = []
+        results = [None] * len(contents)
+        pending = []
+        new_assessments = {}
+        
+        # Look up every cached analysis in a single pass up front
+        cached_results = cache_manager.get_analyses([
+            content.get('content_id') for content in contents if isinstance(content, dict)
+        ])
         
-        for content in contents:
+        to_extract = []
+        for index, content in enumerate(contents):
             try:
                 # Use the same analysis logic as single content
+                _validate_analyze(content)
                 content_id = content.get('content_id')
                 
                 # Check cache first
-                cached_result = cache_manager.get_analysis(content_id)
-                if cached_result:
-                    results.append(cached_result)
+                if content_id in cached_results:
+                    results[index] = cached_results[content_id]
                     continue
                 
-                # Perform analysis
-                features = content_analyzer.extract_features(content)
-                quality_scores = quality_scorer.calculate_scores(features)
-                fraud_score = fraud_detector.assess_risk(content, features)
+                to_extract.append((index, content))
                 
-                assessment = {
-                    'content_id': content_id,
-                    'quality_index': quality_scores['overall_score'],
-                    'scores': quality_scores,
-                    'fraud_risk': fraud_score,
-                    'analysis_timestamp': datetime.utcnow().isoformat()
+            except JsonSchemaException as e:
+                results[index] = {
+                    'content_id': content.get('content_id', 'unknown') if isinstance(content, dict) else 'unknown',
+                    'error': e.message
                 }
-                
-                results.append(assessment)
-                cache_manager.set_analysis(content_id, assessment)
+        
+        if request.accept_mimetypes.best == 'application/x-ndjson':
+            return Response(
+                stream_with_context(_stream_batch(results, to_extract, now_iso)),
+                mimetype='application/x-ndjson'
+            )
+        
+        # Extract features for every content that isn't cached yet, sharing semantic analysis calls
+        extracted = _extract_features_batch_safe([content for _, content in to_extract])
+        for (index, content), (features, error) in zip(to_extract, extracted):
+            if error is not None:
+                logger.error("Error analyzing content %s: %s", content.get('content_id', 'unknown'), error)
+                results[index] = {
+                    'content_id': content.get('content_id', 'unknown'),
+                    'error': error
+                }
+            else:
+                pending.append((index, content, features))
+        
+        # Score all pending contents in one vectorized pass
+        batch_scores = quality_scorer.calculate_scores_batch([features for _, _, features in pending])
+        
+        for (index, content, features), quality_scores in zip(pending, batch_scores):
+            content_id = content.get('content_id')
+            try:
+                assessment = _build_batch_assessment(content, features, quality_scores, now_iso)
+                results[index] = assessment
+                new_assessments[content_id] = assessment
                 
             except Exception as e:
-                logger.error(f"Error analyzing content {content.get('content_id', 'unknown')}: {str(e)}")
-                results.append({
-                    'content_id': content.get('content_id', 'unknown'),
+                logger.error("Error analyzing content %s: %s", content_id, e)
+                results[index] = {
+                    'content_id': content_id,
                     'error': str(e)
-                })
+                }
+        
+        # Cache all new results together
+        if new_assessments:
+            cache_manager.set_analyses(new_assessments)
         
         return jsonify({
             'batch_results': results,
             'total_processed': len(results),
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': now_iso
         }), 200
 
     except Exception as e:
-        logger.error(f"Error in batch analysis: {str(e)}")
+        logger.error("Error in batch analysis: %s", e)
         return jsonify({
             'error': 'Internal server error',
             'message': str(e)
         }), 500
 
+def _stream_batch(results, to_extract, now_iso):
+    """Yield NDJSON lines: resolved items first, then each analysis as it completes"""
+    for index, result in enumerate(results):
+        if result is not None:
+            yield orjson.dumps({'index': index, **result}) + b'\n'
+    
+    futures = {
+        _batch_executor.submit(_extract_features_safe, content): (index, content)
+        for index, content in to_extract
+    }
+    for future in as_completed(futures):
+        index, content = futures[future]
+        content_id = content.get('content_id', 'unknown')
+        features, error = future.result()
+        if error is None:
+            try:
+                quality_scores = quality_scorer.calculate_scores(features)
+                result = _build_batch_assessment(content, features, quality_scores, now_iso)
+                cache_manager.set_analysis(content_id, result)
+            except Exception as e:
+                error = str(e)
+        if error is not None:
+            logger.error("Error analyzing content %s: %s", content_id, error)
+            result = {'content_id': content_id, 'error': error}
+        yield orjson.dumps({'index': index, **result}) + b'\n'
+
+def _build_batch_assessment(content, features, quality_scores, now_iso):
+    """Compile the assessment returned for one batch item"""
+    return {
+        'content_id': content.get('content_id'),
+        'quality_index': quality_scores['overall_score'],
+        'scores': quality_scores,
+        'fraud_risk': fraud_detector.assess_risk(content, features),
+        'analysis_timestamp': now_iso
+    }
+
+def _extract_features_batch_safe(contents):
+    """Extract features for batch items, returning (features, error) pairs instead of raising"""
+    try:
+        return [(features, None) for features in content_analyzer.extract_features_batch(contents)]
+    except Exception as e:
+        return [(None, str(e))] * len(contents)
+
+def _extract_features_safe(content):
+    """Extract features for one batch item, returning (features, error) instead of raising"""
+    try:
+        return content_analyzer.extract_features(content), None
+    except Exception as e:
+        return None, str(e)
+
 @app.route('/api/quality/trends', methods=['GET'])
+@cache.cached(timeout=60, query_string=True, response_filter=_is_ok_response)
 def get_quality_trends():
     """Get quality trends and analytics"""
     try:
@@ -227,7 +395,7 @@ def get_quality_trends():
         return jsonify(trends), 200
 
     except Exception as e:
-        logger.error(f"Error getting quality trends: {str(e)}")
+        logger.error("Error getting quality trends: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/fraud/report', methods=['POST'])
@@ -241,10 +409,11 @@ def report_fraud():
         return jsonify(report), 200
 
     except Exception as e:
-        logger.error(f"Error creating fraud report: {str(e)}")
+        logger.error("Error creating fraud report: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/models/status', methods=['GET'])
+@cache.cached(timeout=10, response_filter=_is_ok_response)
 def model_status():
     """Get status of AI models"""
     try:
@@ -259,7 +428,7 @@ def model_status():
         return jsonify(status), 200
 
     except Exception as e:
-        logger.error(f"Error getting model status: {str(e)}")
+        logger.error("Error getting model status: %s", e)
         return jsonify({'error': str(e)}), 500
 
 # Frontend-friendly route aliases
@@ -268,7 +437,8 @@ def analyze_content_simple():
     """Simplified analyze endpoint for frontend compatibility"""
     try:
         data = request.get_json()
-        logger.info(f"🎯 Received analyze request: {data}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("🎯 Received analyze request: %s", data)
         
         # Mock response for demo
         mock_analysis = {
@@ -286,14 +456,15 @@ def analyze_content_simple():
                 'comments': '450 - 680',
                 'shares': '320 - 580'
             },
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': _now_iso()
         }
         
-        logger.info(f"✅ Analysis complete: {mock_analysis}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("✅ Analysis complete: %s", mock_analysis)
         return jsonify(mock_analysis), 200
         
     except Exception as e:
-        logger.error(f"Error in simple analyze: {str(e)}")
+        logger.error("Error in simple analyze: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/recommendations', methods=['POST'])
@@ -301,7 +472,8 @@ def get_recommendations():
     """AI-powered content recommendations"""
     try:
         data = request.get_json()
-        logger.info(f"🤖 Received recommendations request: {data}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("🤖 Received recommendations request: %s", data)
         
         # Mock recommendations for demo
         mock_recommendations = {
@@ -331,21 +503,20 @@ def get_recommendations():
                 'engagement_preferences': 'Interactive content',
                 'growth_opportunity': '+28% potential reach'
             },
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': _now_iso()
         }
         
-        logger.info(f"✅ Recommendations generated: {mock_recommendations}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("✅ Recommendations generated: %s", mock_recommendations)
         return jsonify(mock_recommendations), 200
         
     except Exception as e:
-        logger.error(f"Error generating recommendations: {str(e)}")
+        logger.error("Error generating recommendations: %s", e)
         return jsonify({'error': str(e)}), 500
 
 def _check_openai_connection():
     """Check OpenAI API connection"""
     try:
-        # For demo purposes, simulate API check
-        # In production with openai>=1.0, use: client = openai.OpenAI(); client.models.list()
         api_key = os.getenv('OPENAI_API_KEY')
         
         if not api_key:
@@ -354,12 +525,11 @@ def _check_openai_connection():
                 'message': 'OpenAI API key not configured'
             }
         
-        # Mock successful connection for demo
+        models = openai_client.models.list()
         return {
             'status': 'connected',
-            'models_available': 10,
-            'primary_model': os.getenv('OPENAI_MODEL', 'gpt-4'),
-            'note': 'Mock connection for demo'
+            'models_available': len(models.data),
+            'primary_model': os.getenv('OPENAI_MODEL', 'gpt-4')
         }
     except Exception as e:
         return {
@@ -372,15 +542,23 @@ def not_found(error):
     return jsonify({
         'error': 'Not Found',
         'message': 'The requested endpoint was not found',
-        'timestamp': datetime.utcnow().isoformat()
+        'timestamp': _now_iso()
     }), 404
 
+@app.errorhandler(413)
+def payload_too_large(error):
+    return jsonify({
+        'error': 'Payload Too Large',
+        'message': f"Request body exceeds the {app.config['MAX_CONTENT_LENGTH']} byte limit",
+        'timestamp': _now_iso()
+    }), 413
+
 @app.errorhandler(500)
 def internal_error(error):
     return jsonify({
         'error': 'Internal Server Error',
         'message': 'An unexpected error occurred',
-        'timestamp': datetime.utcnow().isoformat()
+        'timestamp': _now_iso()
     }), 500
 
 if __name__ == '__main__':
@@ -391,14 +569,15 @@ if __name__ == '__main__':
     port = int(os.getenv('AI_SERVICE_PORT', 5000))
     debug = os.getenv('FLASK_ENV') == 'development'
     
-    logger.info(f"🤖 Starting CreatorCoin AI Service on port {port}")
-    logger.info(f"🔗 Health check available at http://localhost:{port}/health")
-    logger.info(f"📊 API endpoints available at http://localhost:{port}/api")
+    logger.info("🤖 Starting CreatorCoin AI Service on port %s", port)
+    logger.info("🔗 Health check available at http://localhost:%s/health", port)
+    logger.info("📊 API endpoints available at http://localhost:%s/api", port)
     
-    # Run the application
+    # Development server only; production runs under gunicorn + gevent:
+    #   gunicorn -c gunicorn.conf.py wsgi:app
     app.run(
         host='0.0.0.0',
         port=port,
         debug=debug,
-        threaded=True
+        threaded=False
     )
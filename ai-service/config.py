@@ -1,9 +1,15 @@
 import os
+import re
+import math
+import functools
 from typing import Dict, Any
 
 class Config:
     """Configuration management for CreatorCoin AI Service"""
     
+    # Settings live on the class; instances carry no per-instance __dict__
+    __slots__ = ()
+    
     # Flask settings
     DEBUG = os.getenv('DEBUG', 'True').lower() == 'true'
     TESTING = os.getenv('TESTING', 'False').lower() == 'true'
@@ -18,15 +24,17 @@ class Config:
     OPENAI_MAX_TOKENS = int(os.getenv('OPENAI_MAX_TOKENS', '2048'))
     
     # Content analysis settings
+    _SIZE_UNITS = {'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3}
     _max_file_size_str = os.getenv('MAX_FILE_SIZE', '100')
-    if _max_file_size_str.upper().endswith('MB'):
-        MAX_FILE_SIZE = int(_max_file_size_str[:-2]) * 1024 * 1024
-    elif _max_file_size_str.upper().endswith('GB'):
-        MAX_FILE_SIZE = int(_max_file_size_str[:-2]) * 1024 * 1024 * 1024
-    elif _max_file_size_str.upper().endswith('KB'):
-        MAX_FILE_SIZE = int(_max_file_size_str[:-2]) * 1024
-    else:
-        MAX_FILE_SIZE = int(_max_file_size_str) * 1024 * 1024  # Default to MB
+    _max_file_size_match = re.fullmatch(r'(\d+)\s*(KB|MB|GB)?', _max_file_size_str.strip().upper())
+    if not _max_file_size_match:
+        raise ValueError(f"Invalid MAX_FILE_SIZE: {_max_file_size_str}")
+    MAX_FILE_SIZE = int(_max_file_size_match.group(1)) * _SIZE_UNITS[_max_file_size_match.group(2) or 'MB']  # Default to MB
+    
+    # Request body limits; Flask rejects bodies above MAX_CONTENT_LENGTH with 413 before parsing
+    MAX_CONTENT_LENGTH = min(int(os.getenv('MAX_CONTENT_LENGTH', str(2 * 1024 * 1024))), MAX_FILE_SIZE)
+    MAX_BATCH_PAYLOAD_SIZE = int(os.getenv('MAX_BATCH_PAYLOAD_SIZE', str(1024 * 1024)))
+    
     SUPPORTED_VIDEO_FORMATS = ['mp4', 'avi', 'mov', 'mkv', 'webm']
     SUPPORTED_IMAGE_FORMATS = ['jpg', 'jpeg', 'png', 'gif', 'webp']
     SUPPORTED_AUDIO_FORMATS = ['mp3', 'wav', 'aac', 'ogg', 'flac']
@@ -39,15 +47,22 @@ class Config:
         'safety': 0.20,
         'production': 0.15
     }
+    # Weights are constants, so check they sum to 1.0 once at import instead of on every validation
+    assert math.isclose(sum(QUALITY_WEIGHTS.values()), 1.0, abs_tol=1e-9), "Quality weights must sum to 1.0"
     
     # Cache settings
     CACHE_TTL = int(os.getenv('CACHE_TTL', '3600'))  # 1 hour
     CACHE_CLEANUP_INTERVAL = int(os.getenv('CACHE_CLEANUP_INTERVAL', '1800'))  # 30 minutes
     
-    # Redis settings (for future use)
+    # Redis settings
     REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
     REDIS_PASSWORD = os.getenv('REDIS_PASSWORD', '')
     
+    # Response cache settings (Flask-Caching), Redis-backed when REDIS_URL is configured
+    CACHE_TYPE = os.getenv('CACHE_TYPE', 'RedisCache' if os.getenv('REDIS_URL') else 'SimpleCache')
+    CACHE_REDIS_URL = REDIS_URL
+    CACHE_DEFAULT_TIMEOUT = int(os.getenv('CACHE_DEFAULT_TIMEOUT', '30'))
+    
     # Database settings (for future use)
     DATABASE_URL = os.getenv('DATABASE_URL', 'postgresql://localhost:5432/creatorcoin_ai')
     
@@ -102,13 +117,18 @@ class Config:
     @classmethod
     def get_config(cls) -> Dict[str, Any]:
         """Get all configuration as a dictionary"""
-        config = {}
-        for attr in dir(cls):
-            if not attr.startswith('_') and not callable(getattr(cls, attr)):
-                config[attr] = getattr(cls, attr)
-        return config
+        return dict(cls._collect_config())
     
     @classmethod
+    @functools.lru_cache(maxsize=1)
+    def _collect_config(cls) -> Dict[str, Any]:
+        """Collect configuration attributes once, they don't change after import"""
+        # vars() reads the class namespace directly; settings are the upper-case names
+        return {key: value for key, value in vars(cls).items()
+                if key.isupper() and not key.startswith('_')}
+    
+    @classmethod
+    @functools.cache
     def validate_config(cls) -> bool:
         """Validate critical configuration settings"""
         errors = []
@@ -121,11 +141,6 @@ class Config:
         if not (1 <= cls.PORT <= 65535):
             errors.append(f"Invalid port: {cls.PORT}")
         
-        # Check quality weights sum to 1.0
-        weight_sum = sum(cls.QUALITY_WEIGHTS.values())
-        if abs(weight_sum - 1.0) > 0.01:
-            errors.append(f"Quality weights must sum to 1.0, got {weight_sum}")
-        
         if errors:
             print("Configuration errors:")
             for error in errors:
@@ -137,6 +152,6 @@ class Config:
 # Create a default config instance
 config = Config()
 
-# Validate configuration on import
-if not config.validate_config():
+# Validate configuration on import, skipped in production so forked workers start faster
+if os.getenv('FLASK_ENV') != 'production' and not config.validate_config():
     print("Warning: Configuration validation failed. Some features may not work correctly.")
@@ -4,15 +4,19 @@ Sophisticated algorithms for content quality assessment and fraud detection
 """
 
 import os
-import json
+import orjson
 import logging
 import asyncio
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+import time
+import weakref
+from typing import Dict, List, Optional, Any, Tuple
 import numpy as np
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 import hashlib
 import re
+from collections import Counter
+import httpx
+from cachetools import LRUCache
 
 # Optional OpenAI import with fallback
 try:
@@ -21,11 +25,232 @@ try:
 except ImportError:
     OPENAI_AVAILABLE = False
 
+# Optional Numba import with fallback
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Optional Aho-Corasick automaton for multi-keyword matching
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Connection pool shared by every request made through the async OpenAI client
+_OPENAI_HTTP_LIMITS = httpx.Limits(max_connections=100)
+
+_OPENAI_SYSTEM_PROMPT = "You are an expert content quality analyst for social media platforms. Provide precise, actionable analysis."
+
+# Completion budget per item in a multi-item request, which skips the scoring rationale
+_BATCH_TOKENS_PER_ITEM = 500
+
+# Response parsing patterns, compiled once at import. The model's reply is untrusted text,
+# so each gap is a bounded run of a character class that cannot overlap what follows it;
+# no pattern can backtrack more than _PARSE_GAP_CHARS characters per starting position.
+_PARSE_GAP_CHARS = 128
+_SCORE_PATTERNS = tuple(
+    (key, re.compile(rf'{label}[^\d\n]{{0,{_PARSE_GAP_CHARS}}}(\d+)', re.IGNORECASE))
+    for key, label in (
+        ('quality_score', 'quality'),
+        ('engagement_prediction', 'engagement'),
+        ('safety_rating', 'safety'),
+        ('educational_value', 'educational'),
+        ('creativity_score', 'creativity'),
+        ('monetization_potential', 'monetization')
+    )
+)
+_CONFIDENCE_RE = re.compile(
+    rf'confidence(?:[^\d.\n]|\.(?!\d)){{0,{_PARSE_GAP_CHARS}}}(\d*\.?\d+)', re.IGNORECASE
+)
+# Everything after the first ':' up to a blank line or the end of the reply
+_RECOMMENDATIONS_RE = re.compile(
+    rf'recommend[^:]{{0,{_PARSE_GAP_CHARS}}}:((?:[^\n]|\n(?!\n))*)', re.IGNORECASE
+)
+_BULLET_SPLIT_RE = re.compile(r'[•\-\*]')
+
+def _extract_json_object(text: str) -> Optional[str]:
+    """
+    Slice the first complete JSON object out of a model response.
+    
+    Walks forward from the first '{' tracking brace depth, ignoring braces inside
+    string literals, so the text is scanned once with no regex backtracking.
+    Returns None when there is no balanced object.
+    """
+    start = text.find('{')
+    if start == -1:
+        return None
+    depth = 0
+    in_string = False
+    escaped = False
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:index + 1]
+    return None
+
+# Content fields that determine an analysis result, and so make up its cache key
+_CACHE_KEY_FIELDS = ('title', 'description', 'tags', 'duration', 'category')
+
+# Keyword sets used by the local scoring heuristics
+_POSITIVE_KEYWORDS = frozenset(('amazing', 'love', 'great', 'awesome', 'fantastic', 'incredible', 'wonderful'))
+_NEGATIVE_KEYWORDS = frozenset(('hate', 'terrible', 'awful', 'bad', 'horrible', 'disgusting', 'worst'))
+_EDUCATIONAL_KEYWORDS = frozenset(('learn', 'tutorial', 'how to', 'guide', 'explanation', 'science', 'history'))
+_CREATIVE_KEYWORDS = frozenset(('art', 'music', 'dance', 'creative', 'original', 'unique', 'innovative'))
+_HIGH_QUALITY_KEYWORDS = frozenset(('detailed', 'comprehensive', 'accurate', 'well-explained', 'professional'))
+_LOW_QUALITY_KEYWORDS = frozenset(('clickbait', 'misleading', 'fake', 'spam', 'repetitive', 'low-effort'))
+_VIRAL_KEYWORDS = frozenset(('trending', 'challenge', 'reaction', 'funny', 'shocking', 'relatable'))
+_UNSAFE_KEYWORDS = frozenset(('violence', 'drugs', 'inappropriate', 'dangerous', 'illegal'))
+_SAFE_KEYWORDS = frozenset(('educational', 'family-friendly', 'positive', 'inspiring'))
+_EXPLANATION_KEYWORDS = frozenset(('explain', 'because', 'reason', 'why', 'how'))
+_UNIQUE_KEYWORDS = frozenset(('original', 'new', 'first', 'unique', 'never', 'breakthrough'))
+_TRENDING_TAGS = frozenset(('ai', 'tech', 'tutorial', 'challenge', 'viral', 'trending'))
+_CREATIVE_TAGS = frozenset(('art', 'music', 'dance', 'creative', 'diy', 'original'))
+
+# Local scoring as one linear map: each feature below contributes its weight to the
+# (quality, engagement, safety, educational, creativity) scores. Capped bonuses such as
+# min(questions * 3, 15) are expressed as weight 3 on min(questions, 5).
+LOCAL_SCORES = ('quality', 'engagement', 'safety', 'educational', 'creativity')
+_SCORE_FEATURES = (
+    'long_text', 'very_long_text', 'multi_sentence', 'high_quality', 'low_quality',
+    'viral', 'trending_tags', 'questions_capped', 'exclamations_capped',
+    'unsafe', 'safe_capped',
+    'educational', 'how_to_title', 'step_by_step', 'explanation_capped',
+    'creative', 'unique', 'creative_tags', 'vocabulary_richness'
+)
+_SCORE_WEIGHTS = np.array([
+    # quality engagement safety educational creativity
+    [10, 0, 0, 0, 0],     # long_text: more than 100 characters
+    [10, 0, 0, 0, 0],     # very_long_text: more than 300 characters
+    [10, 0, 0, 0, 0],     # multi_sentence: at least two '.'
+    [5, 0, 0, 0, 0],      # high_quality keywords
+    [-10, 0, 0, 0, 0],    # low_quality keywords
+    [0, 8, 0, 0, 0],      # viral_potential keywords
+    [0, 10, 0, 0, 0],     # trending tags
+    [0, 3, 0, 0, 0],      # '?' count, capped at 5
+    [0, 2, 0, 0, 0],      # '!' count, capped at 5
+    [0, 0, -20, 0, 0],    # unsafe keywords
+    [0, 0, 5, 0, 0],      # safe keywords, capped at 3
+    [0, 0, 0, 12, 0],     # educational keywords
+    [0, 0, 0, 25, 0],     # 'how to' or 'tutorial' in the title
+    [0, 0, 0, 15, 0],     # 'step' anywhere
+    [0, 0, 0, 5, 0],      # explanation keywords, capped at 4
+    [0, 0, 0, 0, 10],     # creative keywords
+    [0, 0, 0, 0, 8],      # unique keywords
+    [0, 0, 0, 0, 12],     # creative tags
+    [0, 0, 0, 0, 30],     # unique words / total words
+], dtype=np.float64)
+_SCORE_BIAS = np.array([50, 40, 100, 20, 30], dtype=np.float64)
+
+# Every duration-dependent value is piecewise constant over the same buckets:
+# <= 0, (0, 15), [15, 30), exactly 30, (30, 60], (60, 120] and > 120 seconds.
+# Each break is the smallest duration in the next bucket, so the bucket of a duration
+# is np.searchsorted(_DURATION_BREAKS, duration, side='right').
+_DURATION_BREAKS = np.array([
+    np.nextafter(0.0, np.inf), 15.0, 30.0, np.nextafter(30.0, np.inf),
+    np.nextafter(60.0, np.inf), np.nextafter(120.0, np.inf)
+])
+_DURATION_SCORE_BONUS = np.array([
+    # quality engagement safety educational creativity
+    [0, 0, 0, 0, 0],
+    [5, 0, 0, 0, 0],
+    [15, 20, 0, 0, 0],
+    [15, 20, 0, 0, 0],
+    [15, 10, 0, 0, 0],
+    [5, 0, 0, 0, 0],
+    [5, 0, 0, 0, 0],
+], dtype=np.float64)
+# Ad placement: pre-roll from 15 seconds, mid-roll from 30
+_DURATION_MONETIZATION_FACTOR = np.array([1.0, 1.0, 1.1, 1.2, 1.2, 1.2, 1.2])
+# Platform fit: 15-30 seconds is the sweet spot, short clips and long videos lose out
+_DURATION_ASSESSMENT = np.array([0, 50, 100, 100, 85, 70, 30], dtype=np.float64)
+
+def _duration_bucket(duration: float) -> int:
+    """Row of the duration lookup tables for a duration in seconds"""
+    return int(np.searchsorted(_DURATION_BREAKS, duration, side='right'))
+
+def _score_kernel(features, weights, bias, duration_bonus, duration_factor):
+    """
+    Local scores from the feature vector: the five LOCAL_SCORES followed by monetization.
+    
+    duration_bonus and duration_factor are the duration's rows of _DURATION_SCORE_BONUS and
+    _DURATION_MONETIZATION_FACTOR. Pure numeric so it can be compiled; the dot product is
+    written out to avoid a BLAS dependency.
+    """
+    scores = np.empty(weights.shape[1] + 1)
+    for j in range(weights.shape[1]):
+        total = bias[j] + duration_bonus[j]
+        for i in range(features.shape[0]):
+            total += features[i] * weights[i, j]
+        scores[j] = min(max(total, 0.0), 100.0)
+    
+    # Monetization from quality and engagement, with a duration factor for ad placement
+    monetization = (scores[0] * 0.4 + scores[1] * 0.6) * duration_factor
+    scores[weights.shape[1]] = min(max(monetization, 0.0), 100.0)
+    return scores
+
+if NUMBA_AVAILABLE:
+    # Explicit signature compiles eagerly (and caches to disk) instead of on the first analysis
+    _score_kernel = njit(
+        'float64[::1](float64[::1], float64[:, ::1], float64[::1], float64[::1], float64)',
+        cache=True, fastmath=True
+    )(_score_kernel)
+
+def _build_keyword_matcher(keywords):
+    """
+    Build a function returning which of keywords occur as substrings of a text, in one pass.
+    
+    Matches are the same as checking `keyword in text` for every keyword, including
+    overlapping ones (e.g. 'art' inside 'start').
+    """
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return lambda text: frozenset(keyword for _, keyword in automaton.iter(text))
+    
+    # A lookahead alternation, longest first, finds the longest keyword starting at every
+    # position; any other keyword starting there is a prefix of it, so expanding each match
+    # to the keywords it contains recovers every occurring keyword
+    ordered = sorted(keywords, key=len, reverse=True)
+    pattern = re.compile('(?=(' + '|'.join(map(re.escape, ordered)) + '))')
+    contained = {keyword: frozenset(other for other in ordered if other in keyword) for keyword in ordered}
+    return lambda text: frozenset().union(*(contained[match] for match in set(pattern.findall(text))))
+
+# Every keyword the local heuristics look for, matched in one scan of the text
+_find_keywords = _build_keyword_matcher(frozenset().union(
+    _POSITIVE_KEYWORDS, _NEGATIVE_KEYWORDS, _EDUCATIONAL_KEYWORDS, _CREATIVE_KEYWORDS,
+    _HIGH_QUALITY_KEYWORDS, _LOW_QUALITY_KEYWORDS, _VIRAL_KEYWORDS,
+    _UNSAFE_KEYWORDS, _SAFE_KEYWORDS, _EXPLANATION_KEYWORDS, _UNIQUE_KEYWORDS, ('step',)
+))
+
+# Number of sentiment categories listing each word, so relevance is one lookup per token
+_SENTIMENT_WORD_WEIGHTS = Counter(
+    word for keywords in (_POSITIVE_KEYWORDS, _NEGATIVE_KEYWORDS, _EDUCATIONAL_KEYWORDS, _CREATIVE_KEYWORDS)
+    for word in keywords
+)
+
+@dataclass(slots=True)
 class ContentAnalysisResult:
     quality_score: float
     engagement_prediction: float
@@ -45,86 +270,115 @@ class EnhancedContentAnalyzer:
     """
     
     def __init__(self):
-        self.openai_client = self._initialize_openai()
-        self.local_models = self._initialize_local_models()
-        self.analysis_cache = {}
-        
-    def _initialize_openai(self) -> Optional[Any]:
-        """Initialize OpenAI client if API key is available"""
+        self.openai_enabled = self._initialize_openai()
+        # One OpenAI client per event loop, since pooled connections belong to the loop that opened them
+        self._openai_clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]' = weakref.WeakKeyDictionary()
+        self.analysis_cache = LRUCache(maxsize=int(os.getenv('ENHANCED_ANALYZER_CACHE_MAX', 4096)))
+        # Longest wait for OpenAI before settling for the local result
+        self.openai_timeout = float(os.getenv('ENHANCED_OPENAI_TIMEOUT', 10.0))
+        # Analyses currently running, so concurrent identical requests share one result
+        self._inflight: Dict[str, asyncio.Task] = {}
+        
+    def _initialize_openai(self) -> bool:
+        """Check whether OpenAI analysis is available (library installed and API key set)"""
         if OPENAI_AVAILABLE and os.getenv('OPENAI_API_KEY'):
-            try:
-                client = openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-                logger.info("OpenAI client initialized successfully")
-                return client
-            except Exception as e:
-                logger.warning(f"Failed to initialize OpenAI client: {e}")
-                return None
-        else:
-            logger.info("OpenAI not available, using local algorithms")
-            return None
+            logger.info("OpenAI analysis enabled")
+            return True
+        logger.info("OpenAI not available, using local algorithms")
+        return False
     
-    def _initialize_local_models(self) -> Dict[str, Any]:
-        """Initialize local ML models and algorithms"""
-        return {
-            'sentiment_keywords': {
-                'positive': ['amazing', 'love', 'great', 'awesome', 'fantastic', 'incredible', 'wonderful'],
-                'negative': ['hate', 'terrible', 'awful', 'bad', 'horrible', 'disgusting', 'worst'],
-                'educational': ['learn', 'tutorial', 'how to', 'guide', 'explanation', 'science', 'history'],
-                'creative': ['art', 'music', 'dance', 'creative', 'original', 'unique', 'innovative']
-            },
-            'quality_indicators': {
-                'high_quality': ['detailed', 'comprehensive', 'accurate', 'well-explained', 'professional'],
-                'low_quality': ['clickbait', 'misleading', 'fake', 'spam', 'repetitive', 'low-effort']
-            },
-            'engagement_patterns': {
-                'viral_potential': ['trending', 'challenge', 'reaction', 'funny', 'shocking', 'relatable'],
-                'retention_signals': ['part', 'series', 'continuation', 'follow-up', 'episode']
-            }
-        }
+    def _openai_client(self) -> Any:
+        """
+        OpenAI client for the running event loop, created on first use in that loop.
+        
+        httpx pools connections per event loop, so a client can't be shared by loops that
+        come and go (e.g. asyncio.run per request); each loop gets its own, dropped with it.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._openai_clients.get(loop)
+        if client is None:
+            client = self._openai_clients[loop] = openai.AsyncOpenAI(
+                api_key=os.getenv('OPENAI_API_KEY'),
+                http_client=httpx.AsyncClient(limits=_OPENAI_HTTP_LIMITS)
+            )
+        return client
     
     async def analyze_content_comprehensive(self, content_data: Dict[str, Any]) -> ContentAnalysisResult:
         """
         Comprehensive content analysis using multiple approaches
         """
-        start_time = datetime.now()
-        
-        # Extract content information
-        title = content_data.get('title', '')
-        description = content_data.get('description', '')
-        tags = content_data.get('tags', [])
-        duration = content_data.get('duration', 0)
-        file_size = content_data.get('file_size', 0)
-        metadata = content_data.get('metadata', {})
+        start_time = time.perf_counter()
+        
+        cache_key = self._generate_cache_key(content_data)
+        cached = self.analysis_cache.get(cache_key)
+        if cached is not None:
+            # Copy so callers can't mutate the cached result
+            return self._copy_result(cached, processing_time=time.perf_counter() - start_time)
+        
+        task = self._inflight.get(cache_key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._analyze_and_cache(cache_key, content_data))
+            self._inflight[cache_key] = task
+        
+        # Every caller, the one that started the analysis included, waits through a shield so
+        # cancelling one caller never cancels the analysis the others are waiting on
+        result = await asyncio.shield(task)
+        return self._copy_result(result, processing_time=time.perf_counter() - start_time)
+    
+    async def _analyze_and_cache(self, cache_key: str, content_data: Dict[str, Any]) -> ContentAnalysisResult:
+        """Run the analysis shared by every concurrent request for cache_key and cache it if allowed"""
+        start_time = time.perf_counter()
+        try:
+            result, cacheable = await self._run_analysis(content_data)
+        finally:
+            self._inflight.pop(cache_key, None)
         
-        # Try OpenAI analysis first, fallback to local algorithms
-        if self.openai_client:
+        result.processing_time = time.perf_counter() - start_time
+        if cacheable:
+            self.analysis_cache[cache_key] = result
+        return result
+    
+    async def _run_analysis(self, content_data: Dict[str, Any]) -> Tuple[ContentAnalysisResult, bool]:
+        """Analyze with OpenAI when configured, falling back to local algorithms; returns (result, cacheable)"""
+        if self.openai_enabled:
+            # Run the local analysis while OpenAI is in flight, so a failure or timeout
+            # costs no extra latency on top of the wait
+            local_task = asyncio.create_task(self._analyze_with_local_algorithms(content_data))
             try:
-                result = await self._analyze_with_openai(content_data)
+                result = await asyncio.wait_for(self._analyze_with_openai(content_data), timeout=self.openai_timeout)
                 result.analysis_method = "OpenAI GPT-4"
                 logger.info("Content analyzed using OpenAI")
+                local_task.cancel()
+                return result, True
+            except asyncio.CancelledError:
+                local_task.cancel()
+                raise
             except Exception as e:
-                logger.warning(f"OpenAI analysis failed: {e}, falling back to local analysis")
-                result = await self._analyze_with_local_algorithms(content_data)
-        else:
-            result = await self._analyze_with_local_algorithms(content_data)
-        
-        # Calculate processing time
-        processing_time = (datetime.now() - start_time).total_seconds()
-        result.processing_time = processing_time
-        
-        return result
+                logger.warning(f"OpenAI analysis failed: {e!r}, falling back to local analysis")
+                # Don't pin the fallback; the next request should retry OpenAI
+                return await local_task, False
+        return await self._analyze_with_local_algorithms(content_data), True
+    
+    @staticmethod
+    def _copy_result(result: ContentAnalysisResult, **changes: Any) -> ContentAnalysisResult:
+        """Copy of a result with its own breakdown and recommendations containers"""
+        return replace(
+            result, breakdown=dict(result.breakdown), recommendations=list(result.recommendations), **changes
+        )
+    
+    def _generate_cache_key(self, content_data: Dict[str, Any]) -> str:
+        """Generate a cache key from the content fields the analysis reads"""
+        canonical = tuple(
+            tuple(value) if isinstance(value, list) else value
+            for value in (content_data.get(field) for field in _CACHE_KEY_FIELDS)
+        )
+        return hashlib.blake2b(repr(canonical).encode(), digest_size=16).hexdigest()
     
     async def _analyze_with_openai(self, content_data: Dict[str, Any]) -> ContentAnalysisResult:
         """Analyze content using OpenAI GPT-4"""
         
         # Prepare content for analysis
-        content_text = f"""
-        Title: {content_data.get('title', '')}
-        Description: {content_data.get('description', '')}
-        Tags: {', '.join(content_data.get('tags', []))}
-        Duration: {content_data.get('duration', 0)} seconds
-        Category: {content_data.get('category', 'unknown')}
-        """
+        content_text = self._format_content_text(content_data)
         
         # Create sophisticated prompt for content analysis
         prompt = f"""
@@ -149,11 +403,10 @@ class EnhancedContentAnalyzer:
         """
         
         try:
-            response = await asyncio.to_thread(
-                self.openai_client.chat.completions.create,
+            response = await self._openai_client().chat.completions.create(
                 model="gpt-4",
                 messages=[
-                    {"role": "system", "content": "You are an expert content quality analyst for social media platforms. Provide precise, actionable analysis."},
+                    {"role": "system", "content": _OPENAI_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.3,
@@ -166,63 +419,175 @@ class EnhancedContentAnalyzer:
             # Extract JSON from response (simplified parsing)
             analysis_data = self._parse_openai_response(analysis_text)
             
-            return ContentAnalysisResult(
-                quality_score=analysis_data.get('quality_score', 85),
-                engagement_prediction=analysis_data.get('engagement_prediction', 75),
-                safety_rating=analysis_data.get('safety_rating', 95),
-                educational_value=analysis_data.get('educational_value', 70),
-                creativity_score=analysis_data.get('creativity_score', 80),
-                monetization_potential=analysis_data.get('monetization_potential', 72),
-                confidence=analysis_data.get('confidence', 0.85),
-                analysis_method="OpenAI GPT-4",
-                breakdown=analysis_data.get('breakdown', {}),
-                recommendations=analysis_data.get('recommendations', []),
-                processing_time=0.0
-            )
+            return self._result_from_openai_data(analysis_data)
             
         except Exception as e:
             logger.error(f"OpenAI analysis error: {e}")
             raise e
     
+    async def analyze_content_batch(self, items: List[Dict[str, Any]], batch_size: int = 8) -> List[ContentAnalysisResult]:
+        """
+        Analyze many content items, scoring up to batch_size of them per OpenAI request.
+        
+        Cached items are answered from the cache and repeated items are analyzed once.
+        Items OpenAI doesn't score (failed or timed-out request, or no entry in the reply)
+        get the local analysis, which isn't cached so a later request retries OpenAI.
+        
+        Returns:
+            One result per item, in the order given
+        """
+        start_time = time.perf_counter()
+        results: List[Optional[ContentAnalysisResult]] = [None] * len(items)
+        
+        # Positions of the uncached items, grouped by content
+        pending: Dict[str, List[int]] = {}
+        for position, content_data in enumerate(items):
+            cache_key = self._generate_cache_key(content_data)
+            cached = self.analysis_cache.get(cache_key)
+            if cached is not None:
+                results[position] = self._copy_result(cached, processing_time=time.perf_counter() - start_time)
+            else:
+                pending.setdefault(cache_key, []).append(position)
+        
+        keys = list(pending)
+        analyzed: Dict[str, ContentAnalysisResult] = {}
+        if self.openai_enabled and keys:
+            chunks = [keys[start:start + batch_size] for start in range(0, len(keys), batch_size)]
+            replies = await asyncio.gather(*(
+                asyncio.wait_for(
+                    self._analyze_batch_with_openai([items[pending[key][0]] for key in chunk]),
+                    # Completion time grows with the number of items answered
+                    timeout=self.openai_timeout * len(chunk)
+                )
+                for chunk in chunks
+            ), return_exceptions=True)
+            for chunk, reply in zip(chunks, replies):
+                if isinstance(reply, BaseException):
+                    logger.warning(f"OpenAI batch analysis failed: {reply!r}, falling back to local analysis")
+                    continue
+                for offset, key in enumerate(chunk):
+                    if offset in reply:
+                        analyzed[key] = reply[offset]
+        
+        processing_time = time.perf_counter() - start_time
+        for key, positions in pending.items():
+            result = analyzed.get(key)
+            if result is None:
+                result = await self._analyze_with_local_algorithms(items[positions[0]])
+                cacheable = not self.openai_enabled
+            else:
+                cacheable = True
+            result.processing_time = processing_time
+            if cacheable:
+                self.analysis_cache[key] = self._copy_result(result)
+            for position in positions:
+                results[position] = self._copy_result(result)
+        return results
+    
+    async def _analyze_batch_with_openai(self, items: List[Dict[str, Any]]) -> Dict[int, ContentAnalysisResult]:
+        """Score several items with one OpenAI request; returns results keyed by position in items"""
+        listing = "\n".join(
+            f"[{index}]{self._format_content_text(content_data)}" for index, content_data in enumerate(items)
+        )
+        prompt = f"""
+        Analyze each of the following social media content items for quality assessment:
+
+        {listing}
+
+        For every item provide scores (0-100) for quality_score, engagement_prediction,
+        safety_rating, educational_value, creativity_score and monetization_potential,
+        plus confidence (0-1) and a short list of recommendations.
+
+        Return only a JSON object of the form {{"results": [...]}} with one object per item,
+        each including "index" (the number in brackets) and the exact field names above.
+        """
+        
+        response = await self._openai_client().chat.completions.create(
+            model="gpt-4",
+            messages=[
+                {"role": "system", "content": _OPENAI_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.3,
+            max_tokens=_BATCH_TOKENS_PER_ITEM * len(items)
+        )
+        
+        json_text = _extract_json_object(response.choices[0].message.content or '')
+        if json_text is None:
+            raise ValueError("OpenAI batch response contained no JSON object")
+        entries = orjson.loads(json_text).get('results', [])
+        
+        results = {}
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            index = entry.get('index')
+            if isinstance(index, int) and 0 <= index < len(items):
+                results[index] = self._result_from_openai_data(entry)
+        logger.info(f"Batch of {len(items)} analyzed using OpenAI, {len(results)} scored")
+        return results
+    
+    @staticmethod
+    def _format_content_text(content_data: Dict[str, Any]) -> str:
+        """Content fields as prompt text"""
+        return f"""
+        Title: {content_data.get('title', '')}
+        Description: {content_data.get('description', '')}
+        Tags: {', '.join(content_data.get('tags', []))}
+        Duration: {content_data.get('duration', 0)} seconds
+        Category: {content_data.get('category', 'unknown')}
+        """
+    
+    @staticmethod
+    def _result_from_openai_data(analysis_data: Dict[str, Any]) -> ContentAnalysisResult:
+        """Build a result from the fields OpenAI returned, defaulting any that are missing"""
+        return ContentAnalysisResult(
+            quality_score=analysis_data.get('quality_score', 85),
+            engagement_prediction=analysis_data.get('engagement_prediction', 75),
+            safety_rating=analysis_data.get('safety_rating', 95),
+            educational_value=analysis_data.get('educational_value', 70),
+            creativity_score=analysis_data.get('creativity_score', 80),
+            monetization_potential=analysis_data.get('monetization_potential', 72),
+            confidence=analysis_data.get('confidence', 0.85),
+            analysis_method="OpenAI GPT-4",
+            breakdown=analysis_data.get('breakdown', {}),
+            recommendations=analysis_data.get('recommendations', []),
+            processing_time=0.0
+        )
+    
     def _parse_openai_response(self, response_text: str) -> Dict[str, Any]:
         """Parse OpenAI response to extract analysis data"""
-        try:
-            # Try to extract JSON from response
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-        except:
-            pass
+        # The message content is None when the model returns no text
+        response_text = response_text or ''
+        
+        # Try to extract JSON from response
+        json_text = _extract_json_object(response_text)
+        if json_text is not None:
+            try:
+                return orjson.loads(json_text)
+            except orjson.JSONDecodeError:
+                pass
         
         # Fallback parsing using regex patterns
         scores = {}
         
         # Extract numerical scores
-        patterns = {
-            'quality_score': r'quality.*?(\d+)',
-            'engagement_prediction': r'engagement.*?(\d+)',
-            'safety_rating': r'safety.*?(\d+)',
-            'educational_value': r'educational.*?(\d+)',
-            'creativity_score': r'creativity.*?(\d+)',
-            'monetization_potential': r'monetization.*?(\d+)'
-        }
-        
-        for key, pattern in patterns.items():
-            match = re.search(pattern, response_text, re.IGNORECASE)
+        for key, pattern in _SCORE_PATTERNS:
+            match = pattern.search(response_text)
             scores[key] = int(match.group(1)) if match else 75
         
         # Extract confidence
-        conf_match = re.search(r'confidence.*?(\d*\.?\d+)', response_text, re.IGNORECASE)
+        conf_match = _CONFIDENCE_RE.search(response_text)
         confidence = float(conf_match.group(1)) if conf_match else 0.8
         if confidence > 1:
             confidence = confidence / 100
         
         # Extract recommendations
         recommendations = []
-        rec_section = re.search(r'recommend.*?:(.*?)(?:\n\n|\Z)', response_text, re.IGNORECASE | re.DOTALL)
+        rec_section = _RECOMMENDATIONS_RE.search(response_text)
         if rec_section:
             rec_text = rec_section.group(1)
-            recommendations = [r.strip() for r in re.split(r'[•\-\*]', rec_text) if r.strip()]
+            recommendations = [r.strip() for r in _BULLET_SPLIT_RE.split(rec_text) if r.strip()]
         
         return {
             **scores,
@@ -236,23 +601,26 @@ class EnhancedContentAnalyzer:
         Sophisticated local analysis using advanced algorithms
         """
         
-        title = content_data.get('title', '').lower()
-        description = content_data.get('description', '').lower()
-        tags = [tag.lower() for tag in content_data.get('tags', [])]
+        # Case-fold once for every substring check; the raw title keeps its capitalization
+        raw_title = content_data.get('title', '')
+        title = raw_title.casefold()
+        description = content_data.get('description', '').casefold()
+        tags = tuple(tag.casefold() for tag in content_data.get('tags', []))
         duration = content_data.get('duration', 0)
         
         # Combine all text for analysis
         full_text = f"{title} {description} {' '.join(tags)}"
         
+        # Scan and tokenize the text once for every heuristic below
+        keywords = _find_keywords(full_text)
+        word_counts = Counter(full_text.split())
+        char_counts = Counter(full_text)
+        
         # Calculate various quality metrics
-        quality_score = self._calculate_quality_score(full_text, duration)
-        engagement_prediction = self._predict_engagement(full_text, tags, duration)
-        safety_rating = self._calculate_safety_rating(full_text)
-        educational_value = self._calculate_educational_value(full_text, title)
-        creativity_score = self._calculate_creativity_score(full_text, tags)
-        monetization_potential = self._calculate_monetization_potential(
-            quality_score, engagement_prediction, duration
-        )
+        (quality_score, engagement_prediction, safety_rating, educational_value,
+         creativity_score, monetization_potential) = self._calculate_local_scores(
+            full_text, title, tags, duration, keywords, word_counts, char_counts
+        ).tolist()
         
         # Calculate overall confidence based on text length and completeness
         confidence = self._calculate_confidence(content_data)
@@ -265,8 +633,8 @@ class EnhancedContentAnalyzer:
         # Create breakdown
         breakdown = {
             'content_length': min(len(full_text) / 10, 100),
-            'keyword_relevance': self._calculate_keyword_relevance(full_text),
-            'title_quality': self._assess_title_quality(title),
+            'keyword_relevance': self._calculate_keyword_relevance(full_text, word_counts),
+            'title_quality': self._assess_title_quality(raw_title),
             'description_quality': self._assess_description_quality(description),
             'duration_optimization': self._assess_duration(duration)
         }
@@ -285,150 +653,46 @@ class EnhancedContentAnalyzer:
             processing_time=0.0
         )
     
-    def _calculate_quality_score(self, text: str, duration: int) -> float:
-        """Calculate content quality score using multiple factors"""
-        score = 50  # Base score
-        
-        # Text quality factors
-        if len(text) > 100:
-            score += 10
-        if len(text) > 300:
-            score += 10
-        
-        # Check for quality indicators
-        high_quality_count = sum(1 for word in self.local_models['quality_indicators']['high_quality'] 
-                                if word in text)
-        low_quality_count = sum(1 for word in self.local_models['quality_indicators']['low_quality'] 
-                               if word in text)
-        
-        score += high_quality_count * 5
-        score -= low_quality_count * 10
-        
-        # Duration optimization
-        if 15 <= duration <= 60:  # Optimal duration for social media
-            score += 15
-        elif duration > 0:
-            score += 5
-        
-        # Grammar and structure (simplified)
-        sentences = text.split('.')
-        if len(sentences) > 2:
-            score += 10
-        
-        return min(max(score, 0), 100)
-    
-    def _predict_engagement(self, text: str, tags: List[str], duration: int) -> float:
-        """Predict engagement potential"""
-        score = 40  # Base engagement score
-        
-        # Viral potential keywords
-        viral_words = sum(1 for word in self.local_models['engagement_patterns']['viral_potential'] 
-                         if word in text)
-        score += viral_words * 8
-        
-        # Trending tags boost
-        trending_tags = ['ai', 'tech', 'tutorial', 'challenge', 'viral', 'trending']
-        trending_count = sum(1 for tag in tags if tag in trending_tags)
-        score += trending_count * 10
-        
-        # Optimal duration for engagement
-        if 15 <= duration <= 30:
-            score += 20
-        elif 30 < duration <= 60:
-            score += 10
-        
-        # Text engagement factors
-        question_marks = text.count('?')
-        exclamation_marks = text.count('!')
-        score += min(question_marks * 3, 15)
-        score += min(exclamation_marks * 2, 10)
-        
-        return min(max(score, 0), 100)
-    
-    def _calculate_safety_rating(self, text: str) -> float:
-        """Calculate content safety rating"""
-        score = 100  # Start with perfect safety
-        
-        # Check for problematic content (simplified)
-        unsafe_keywords = ['violence', 'drugs', 'inappropriate', 'dangerous', 'illegal']
-        unsafe_count = sum(1 for word in unsafe_keywords if word in text)
-        score -= unsafe_count * 20
-        
-        # Positive safety indicators
-        safe_keywords = ['educational', 'family-friendly', 'positive', 'inspiring']
-        safe_count = sum(1 for word in safe_keywords if word in text)
-        score += min(safe_count * 5, 15)
-        
-        return min(max(score, 0), 100)
-    
-    def _calculate_educational_value(self, text: str, title: str) -> float:
-        """Calculate educational value"""
-        score = 20  # Base educational score
-        
-        # Educational keywords
-        edu_words = sum(1 for word in self.local_models['sentiment_keywords']['educational'] 
-                       if word in text)
-        score += edu_words * 12
-        
-        # How-to content gets bonus
-        if 'how to' in title or 'tutorial' in title:
-            score += 25
-        
-        # Step-by-step content
-        if 'step' in text or 'steps' in text:
-            score += 15
+    def _calculate_local_scores(self, text: str, title: str, tags: Tuple[str, ...], duration: float,
+                                keywords: frozenset, word_counts: Counter, char_counts: Counter) -> np.ndarray:
+        """
+        Calculate the local scores and monetization potential at once.
         
-        # Explanation quality
-        explanation_words = ['explain', 'because', 'reason', 'why', 'how']
-        explanation_count = sum(1 for word in explanation_words if word in text)
-        score += min(explanation_count * 5, 20)
+        The text signals are gathered into one feature vector and mapped to all five
+        scores against _SCORE_WEIGHTS by _score_kernel (compiled when Numba is available).
         
-        return min(max(score, 0), 100)
-    
-    def _calculate_creativity_score(self, text: str, tags: List[str]) -> float:
-        """Calculate creativity score"""
-        score = 30  # Base creativity score
-        
-        # Creative keywords
-        creative_words = sum(1 for word in self.local_models['sentiment_keywords']['creative'] 
-                            if word in text)
-        score += creative_words * 10
-        
-        # Unique content indicators
-        unique_words = ['original', 'new', 'first', 'unique', 'never', 'breakthrough']
-        unique_count = sum(1 for word in unique_words if word in text)
-        score += unique_count * 8
-        
-        # Creative tags
-        creative_tags = ['art', 'music', 'dance', 'creative', 'diy', 'original']
-        creative_tag_count = sum(1 for tag in tags if tag in creative_tags)
-        score += creative_tag_count * 12
-        
-        # Text complexity as creativity indicator
-        unique_word_count = len(set(text.split()))
-        total_word_count = len(text.split())
-        if total_word_count > 0:
-            vocabulary_richness = unique_word_count / total_word_count
-            score += vocabulary_richness * 30
-        
-        return min(max(score, 0), 100)
-    
-    def _calculate_monetization_potential(self, quality: float, engagement: float, duration: int) -> float:
-        """Calculate monetization potential"""
-        # Base calculation from quality and engagement
-        base_score = (quality * 0.4 + engagement * 0.6)
-        
-        # Duration factor for ad placement
-        duration_factor = 1.0
-        if duration >= 30:  # Better for mid-roll ads
-            duration_factor = 1.2
-        elif duration >= 15:  # Good for pre-roll
-            duration_factor = 1.1
-        
-        # Apply duration factor
-        score = base_score * duration_factor
-        
-        return min(max(score, 0), 100)
+        Returns:
+            Array of the five scores in LOCAL_SCORES order plus monetization potential,
+            each clipped to [0, 100]
+        """
+        word_total = sum(word_counts.values())
+        features = np.array([
+            len(text) > 100,
+            len(text) > 300,
+            char_counts['.'] >= 2,
+            len(keywords & _HIGH_QUALITY_KEYWORDS),
+            len(keywords & _LOW_QUALITY_KEYWORDS),
+            len(keywords & _VIRAL_KEYWORDS),
+            sum(1 for tag in tags if tag in _TRENDING_TAGS),
+            min(char_counts['?'], 5),
+            min(char_counts['!'], 5),
+            len(keywords & _UNSAFE_KEYWORDS),
+            min(len(keywords & _SAFE_KEYWORDS), 3),
+            len(keywords & _EDUCATIONAL_KEYWORDS),
+            'how to' in title or 'tutorial' in title,
+            'step' in keywords,
+            min(len(keywords & _EXPLANATION_KEYWORDS), 4),
+            len(keywords & _CREATIVE_KEYWORDS),
+            len(keywords & _UNIQUE_KEYWORDS),
+            sum(1 for tag in tags if tag in _CREATIVE_TAGS),
+            len(word_counts) / word_total if word_total else 0.0
+        ], dtype=np.float64)
+        
+        bucket = _duration_bucket(duration)
+        return _score_kernel(
+            features, _SCORE_WEIGHTS, _SCORE_BIAS,
+            _DURATION_SCORE_BONUS[bucket], _DURATION_MONETIZATION_FACTOR[bucket]
+        )
     
     def _calculate_confidence(self, content_data: Dict[str, Any]) -> float:
         """Calculate analysis confidence based on available data"""
@@ -469,25 +733,28 @@ class EnhancedContentAnalyzer:
         
         return recommendations[:5]  # Limit to 5 recommendations
     
-    def _calculate_keyword_relevance(self, text: str) -> float:
+    def _calculate_keyword_relevance(self, text: str, word_counts: Optional[Counter] = None) -> float:
         """Calculate keyword relevance score"""
-        words = text.split()
-        if not words:
+        if word_counts is None:
+            word_counts = Counter(text.split())
+        word_total = sum(word_counts.values())
+        if not word_total:
             return 0
         
-        # Count relevant keywords across all categories
-        relevant_count = 0
-        for category in self.local_models['sentiment_keywords'].values():
-            relevant_count += sum(1 for word in words if word in category)
+        # Count relevant keywords across all categories, one lookup per distinct word
+        weights = _SENTIMENT_WORD_WEIGHTS
+        relevant_count = sum(weights[word] * count for word, count in word_counts.items())
         
-        return min((relevant_count / len(words)) * 100, 100)
+        return min((relevant_count / word_total) * 100, 100)
     
     def _assess_title_quality(self, title: str) -> float:
-        """Assess title quality"""
+        """Assess title quality (expects the title as written, for the capitalization check)"""
         if not title:
             return 0
         
         score = 50
+        # One pass over the title; the checks below only look at its distinct characters
+        title_chars = Counter(title)
         
         # Optimal length
         if 5 <= len(title.split()) <= 10:
@@ -498,17 +765,17 @@ class EnhancedContentAnalyzer:
             score += 10
         
         # Contains numbers (often engaging)
-        if any(char.isdigit() for char in title):
+        if any(char.isdigit() for char in title_chars):
             score += 10
         
         # Question or exclamation
-        if '?' in title or '!' in title:
+        if '?' in title_chars or '!' in title_chars:
             score += 10
         
         return min(score, 100)
     
     def _assess_description_quality(self, description: str) -> float:
-        """Assess description quality"""
+        """Assess description quality (expects case-folded text)"""
         if not description:
             return 0
         
@@ -527,27 +794,14 @@ class EnhancedContentAnalyzer:
         
         # Call to action
         cta_words = ['subscribe', 'like', 'follow', 'comment', 'share']
-        if any(word in description.lower() for word in cta_words):
+        if any(word in description for word in cta_words):
             score += 15
         
         return min(score, 100)
     
     def _assess_duration(self, duration: int) -> float:
         """Assess video duration optimization"""
-        if duration <= 0:
-            return 0
-        
-        # Optimal durations for different platforms
-        if 15 <= duration <= 30:  # Sweet spot for most platforms
-            return 100
-        elif 30 < duration <= 60:  # Still very good
-            return 85
-        elif 60 < duration <= 120:  # Acceptable for detailed content
-            return 70
-        elif duration < 15:  # Too short
-            return 50
-        else:  # Too long for social media
-            return 30
+        return _DURATION_ASSESSMENT[_duration_bucket(duration)].item()
 
 # Global analyzer instance
 content_analyzer = EnhancedContentAnalyzer()
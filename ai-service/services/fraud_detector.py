@@ -1,18 +1,288 @@
+import os
+import bisect
+import functools
+import math
+import random
 import logging
 import numpy as np
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import hashlib
+import re
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import json
+from cachetools import TTLCache
+
+# Optional fast non-cryptographic hashing for content dedup keys
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Optional Numba import with fallback
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+@functools.lru_cache(maxsize=10_000)
+def _hash_title_description(title: str, description: str) -> int:
+    """64-bit content digest of a title and description (xxh3_64 when available, else blake2b)"""
+    content_bytes = f"{title}{description}".encode()
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_intdigest(content_bytes)
+    return int.from_bytes(hashlib.blake2b(content_bytes, digest_size=8).digest(), 'big')
+
+# Second-granularity ISO timestamps, each swapped atomically as a (second, iso_string) tuple
+_utc_iso_cache = (0, '')
+_local_iso_cache = (0, '')
+
+def _utc_now_iso() -> str:
+    """Current UTC time as an ISO string, formatted at most once per second"""
+    global _utc_iso_cache
+    now = int(time.time())
+    if now != _utc_iso_cache[0]:
+        _utc_iso_cache = (now, datetime.utcfromtimestamp(now).isoformat())
+    return _utc_iso_cache[1]
+
+def _local_now_iso() -> str:
+    """Current local time as an ISO string, formatted at most once per second"""
+    global _local_iso_cache
+    now = int(time.time())
+    if now != _local_iso_cache[0]:
+        _local_iso_cache = (now, datetime.fromtimestamp(now).isoformat())
+    return _local_iso_cache[1]
+
+# Upload-rate window, in monotonic-clock nanoseconds
+_UPLOAD_WINDOW_NS = 3600 * 10**9
+
+# Confidence each content fraud indicator adds when raised
+_CONTENT_FRAUD_WEIGHTS = {
+    'duplicate_content': 0.4,
+    'undisclosed_ai_content': 0.25,
+    'engagement_manipulation': 0.5,
+    'suspicious_behavior': 0.3,
+    'quality_inconsistency': 0.2,
+    'metadata_manipulation': 0.1
+}
+
+# User fraud checks, in order: (indicator type, score threshold, confidence weight, description)
+_USER_FRAUD_CHECKS = (
+    ('upload_rate_abuse', 0.7, 0.3, 'Unusually high upload rate detected'),
+    ('bot_behavior', 0.8, 0.4, 'User behavior patterns suggest automated activity'),
+    ('fake_engagement', 0.6, 0.3, 'Suspicious engagement patterns detected'),
+    ('fake_account', 0.6, 0.4, 'Account appears to be fake or compromised')
+)
+
+# User risk levels: a score at or above each threshold moves up one level
+_RISK_THRESHOLDS = (0.3, 0.5, 0.8)
+_RISK_LEVELS = ('minimal', 'low', 'medium', 'high')
+_RECOMMENDED_ACTIONS = {
+    'high': 'block_content',
+    'medium': 'flag_for_review',
+    'low': 'monitor',
+    'minimal': 'allow',
+    'unknown': 'manual_review'
+}
+
+# AI disclosure wording, matched as whole words in one case-insensitive pass
+_AI_DISCLOSURE_RE = re.compile(
+    r'\b(?:generated|artificial|synthetic|ai[- ]created|machine[- ]generated|automated|algorithmic)\b',
+    re.IGNORECASE
+)
+
+# Perceptual hashes: a 32x32 grayscale DCT reduced to its 8x8 low-frequency block, one bit per coefficient
+PHASH_BITS = 64
+_PHASH_IMAGE_SIZE = 32
+_PHASH_BLOCK_SIZE = 8
+# Batches at least this large hash their images on the worker pool; smaller ones aren't worth the dispatch
+_PARALLEL_BATCH_MIN = 32
+
+# Initial capacity of the perceptual hash array, which doubles whenever it fills
+_PHASH_INITIAL_CAPACITY = 1024
+
+if hasattr(np, 'bitwise_count'):
+    _popcount64 = np.bitwise_count
+else:
+    def _popcount64(values: np.ndarray) -> np.ndarray:
+        """Set bits in each element of a uint64 array (np.bitwise_count needs NumPy 2.0)"""
+        return np.unpackbits(values.view(np.uint8)).reshape(-1, 64).sum(axis=1)
+
+# Series shorter than this are summarized in plain Python, where building an array would
+# cost more than the arithmetic; longer ones go through the compiled kernel
+_SMALL_SERIES = 32
+
+def _mean(values) -> float:
+    """Mean of a short non-empty sequence"""
+    return sum(values) / len(values)
+
+def _pvariance(values) -> float:
+    """Population variance of a short non-empty sequence, in two passes so large offsets don't cancel"""
+    mean = sum(values) / len(values)
+    return sum((value - mean) ** 2 for value in values) / len(values)
+
+def _timing_stats(times, similarities):
+    """
+    (variance of the intervals between consecutive times, mean of similarities) in one pass each.
+    
+    The variance is the population variance, updated with Welford's method; both statistics
+    are 0.0 when there is nothing to average.
+    """
+    mean = 0.0
+    m2 = 0.0
+    for i in range(1, times.shape[0]):
+        interval = times[i] - times[i - 1]
+        delta = interval - mean
+        mean += delta / i
+        m2 += delta * (interval - mean)
+    variance = m2 / (times.shape[0] - 1) if times.shape[0] > 1 else 0.0
+    
+    total = 0.0
+    for similarity in similarities:
+        total += similarity
+    mean_similarity = total / similarities.shape[0] if similarities.shape[0] else 0.0
+    return variance, mean_similarity
+
+if NUMBA_AVAILABLE:
+    # Explicit signature compiles eagerly (and caches to disk) instead of on the first request
+    _timing_stats = njit(
+        'UniTuple(float64, 2)(float64[::1], float64[::1])', cache=True, fastmath=True, nogil=True
+    )(_timing_stats)
+
+@dataclass(slots=True)
+class ContentView:
+    """The fields of a content dictionary the fraud checks read, pulled out once per item"""
+    source: Dict[str, Any]
+    content_id: str = ''
+    creator_id: str = ''
+    title: str = ''
+    description: str = ''
+    tags: Tuple[str, ...] = ()
+    quality_score: float = 0.5
+    image_data: Optional[bytes] = None
+    views: float = 0
+    likes: float = 0
+    comments: float = 0
+    shares: float = 0
+    creation_time: Optional[float] = None
+    upload_time: Optional[float] = None
+    edit_count: int = 0
+    missing_metadata_fields: int = 0
+    has_music: bool = False
+    has_logos: bool = False
+    has_watermarks: bool = False
+    
+    @classmethod
+    def from_dict(cls, content_data: Dict[str, Any]) -> 'ContentView':
+        # Null nested fields read as empty, so one malformed field can't fail every check
+        engagement = content_data.get('engagement') or {}
+        metadata = content_data.get('metadata') or {}
+        audio_features = content_data.get('audio_features') or {}
+        visual_features = content_data.get('visual_features') or {}
+        return cls(
+            source=content_data,
+            content_id=content_data.get('content_id', ''),
+            creator_id=content_data.get('creator_id', ''),
+            title=str(content_data.get('title', '')),
+            description=str(content_data.get('description', '')),
+            tags=tuple(content_data.get('tags') or ()),
+            quality_score=content_data.get('quality_score', 0.5),
+            image_data=content_data.get('image_data'),
+            views=engagement.get('views', 0),
+            likes=engagement.get('likes', 0),
+            comments=engagement.get('comments', 0),
+            shares=engagement.get('shares', 0),
+            creation_time=metadata.get('creation_time'),
+            upload_time=metadata.get('upload_time'),
+            edit_count=metadata.get('edit_count', 0),
+            missing_metadata_fields=sum(1 for field in ('title', 'description', 'duration') if not metadata.get(field)),
+            has_music=bool(audio_features.get('has_music', False)),
+            has_logos=bool(visual_features.get('has_logos', False)),
+            has_watermarks=bool(visual_features.get('has_watermarks', False))
+        )
+
+class DigestBloomFilter:
+    """
+    Scalable Bloom filter over 64-bit digests.
+    
+    Bit positions come from the digest itself by double hashing its two 32-bit halves, so
+    nothing is rehashed. When a layer reaches its capacity a new one twice as large, with
+    half the error rate, is added; the overall false-positive rate stays below 2 * error_rate.
+    """
+    
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 1e-4):
+        self.layers = []  # (bits, bit_count, hash_count, capacity) per layer
+        self.count = 0
+        self._add_layer(capacity, error_rate / 2)
+    
+    def _add_layer(self, capacity: int, error_rate: float) -> None:
+        """Start a new layer sized for capacity digests at error_rate"""
+        bit_count = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        hash_count = max(1, round(bit_count / capacity * math.log(2)))
+        self.layers.append((bytearray((bit_count + 7) // 8), bit_count, hash_count, capacity))
+        self._error_rate = error_rate
+        self._layer_count = 0
+    
+    @staticmethod
+    def _positions(digest: int, bit_count: int, hash_count: int):
+        """Bit positions of a digest in a layer"""
+        low = digest & 0xFFFFFFFF
+        high = (digest >> 32) | 1
+        return ((low + i * high) % bit_count for i in range(hash_count))
+    
+    def __contains__(self, digest: int) -> bool:
+        for bits, bit_count, hash_count, _ in self.layers:
+            if all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(digest, bit_count, hash_count)):
+                return True
+        return False
+    
+    def add(self, digest: int) -> None:
+        """Record a digest; callers check membership first, so each digest is added once"""
+        bits, bit_count, hash_count, capacity = self.layers[-1]
+        if self._layer_count >= capacity:
+            self._add_layer(capacity * 2, self._error_rate / 2)
+            bits, bit_count, hash_count, capacity = self.layers[-1]
+        for position in self._positions(digest, bit_count, hash_count):
+            bits[position >> 3] |= 1 << (position & 7)
+        self._layer_count += 1
+        self.count += 1
+    
+    def __len__(self) -> int:
+        return self.count
 
 class FraudDetector:
     """Advanced fraud detection system for content and user behavior analysis"""
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.content_hashes = set()
-        self.user_behavior_patterns = {}
+        # Workers for the stateless, GIL-releasing parts of batch detection (image decoding and hashing)
+        self._executor = ThreadPoolExecutor(max_workers=int(os.getenv('FRAUD_WORKERS', os.cpu_count() or 4)))
+        # 64-bit digests of every content item seen, for exact-duplicate detection: an exact
+        # set by default, or with FRAUD_EXACT_DEDUP=0 a Bloom filter keeping only ~20 bits per item
+        if os.getenv('FRAUD_EXACT_DEDUP', '1') != '0':
+            self.content_hashes = set()
+            self.content_filter = None
+        else:
+            self.content_hashes = None
+            self.content_filter = DigestBloomFilter(
+                capacity=int(os.getenv('FRAUD_DEDUP_CAPACITY', 1_000_000)),
+                error_rate=float(os.getenv('FRAUD_DEDUP_ERROR_RATE', 1e-4))
+            )
+        # Perceptual hashes of every image seen, for near-duplicate detection; the first
+        # phash_count slots of the contiguous array are in use
+        self.phash_array = np.empty(_PHASH_INITIAL_CAPACITY, dtype=np.uint64)
+        self.phash_count = 0
+        # Per-creator and per-user history, dropped once untouched for the longest window it
+        # is read over (7 days of creator uploads) and capped so idle accounts can't pile up
+        self.user_behavior_patterns = TTLCache(
+            maxsize=int(os.getenv('FRAUD_TRACKED_USERS_MAX', 100_000)),
+            ttl=int(os.getenv('FRAUD_BEHAVIOR_TTL', 86400 * 7))
+        )
         self.known_fraudulent_patterns = []
         
         # Enhanced fraud detection thresholds
@@ -26,6 +296,7 @@ class FraudDetector:
         self.content_similarity_model = None
         self.behavior_analysis_model = None
         self.engagement_prediction_model = None
+        self.ai_detection_model = None  # callable returning the probability content is AI-generated
         
     def detect_content_fraud(self, content_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -38,130 +309,172 @@ class FraudDetector:
             Dictionary with detailed fraud detection results
         """
         try:
-            fraud_indicators = []
-            confidence_score = 0.0
-            risk_level = 'low'
+            view = ContentView.from_dict(content_data)
+            return self._compile_content_fraud_result(
+                view,
+                self._detect_engagement_fraud(view),
+                self._detect_metadata_manipulation(view),
+                self._generate_perceptual_hash(view),
+                _local_now_iso()
+            )
+        except Exception as e:
+            self.logger.error(f"Fraud detection failed for {content_data.get('content_id', 'unknown')}: {str(e)}")
+            return self._get_fallback_fraud_result(content_data)
+    
+    def detect_content_fraud_batch(self, contents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Fraud detection for many content items, equivalent to detect_content_fraud on each in order
+        
+        The stateless engagement and metadata checks run as NumPy operations over columns
+        extracted from the whole batch, and images are perceptually hashed on the worker pool
+        (OpenCV releases the GIL) once the batch reaches _PARALLEL_BATCH_MIN items. Duplicate
+        and creator-history checks stay per item, in order, since each item must see the ones
+        before it.
+        
+        Args:
+            contents: List of content dictionaries, as accepted by detect_content_fraud
             
-            content_id = content_data.get('content_id', '')
-            creator_id = content_data.get('creator_id', '')
-            metadata = content_data.get('metadata', {})
-            
-            # 1. Duplicate content detection
-            duplicate_score = self._check_duplicate_content(content_data)
-            if duplicate_score > self.SIMILARITY_THRESHOLD:
-                fraud_indicators.append({
-                    'type': 'duplicate_content',
-                    'score': round(duplicate_score, 3),
-                    'description': f'Content appears to be {duplicate_score:.1%} similar to existing content',
-                    'severity': 'high' if duplicate_score > 0.95 else 'medium'
-                })
-                confidence_score += 0.4
-                
-            # 2. AI-generated content detection
-            ai_detection_score = self._detect_undisclosed_ai_content(content_data)
-            if ai_detection_score > self.AI_CONTENT_CONFIDENCE_THRESHOLD:
-                fraud_indicators.append({
-                    'type': 'undisclosed_ai_content',
-                    'score': round(ai_detection_score, 3),
-                    'description': f'Content likely AI-generated ({ai_detection_score:.1%} confidence) without proper disclosure',
-                    'severity': 'medium'
-                })
-                confidence_score += 0.25
-                
-            # 3. Engagement manipulation detection
-            engagement_fraud = self._detect_engagement_fraud(content_data)
-            if engagement_fraud['detected']:
-                fraud_indicators.append({
-                    'type': 'engagement_manipulation',
-                    'score': engagement_fraud['confidence'],
-                    'description': engagement_fraud['description'],
-                    'severity': 'high' if engagement_fraud['confidence'] > 0.8 else 'medium',
-                    'details': engagement_fraud['details']
-                })
-                confidence_score += 0.5
-                
-            # 4. Creator behavior analysis
-            behavior_fraud = self._analyze_creator_behavior(creator_id, content_data)
-            if behavior_fraud['suspicious']:
-                fraud_indicators.append({
-                    'type': 'suspicious_behavior',
-                    'score': behavior_fraud['score'],
-                    'description': behavior_fraud['description'],
-                    'severity': behavior_fraud['severity'],
-                    'patterns': behavior_fraud['patterns']
-                })
-                confidence_score += 0.3
-                
-            # 5. Content quality consistency analysis
-            quality_fraud = self._detect_quality_inconsistency(creator_id, content_data)
-            if quality_fraud['detected']:
-                fraud_indicators.append({
-                    'type': 'quality_inconsistency',
-                    'score': quality_fraud['score'],
-                    'description': quality_fraud['description'],
-                    'severity': 'medium'
-                })
-                confidence_score += 0.2
-                
-            # 6. Metadata manipulation detection
-            metadata_fraud = self._detect_metadata_manipulation(metadata)
-            if metadata_fraud['detected']:
-                fraud_indicators.append({
-                    'type': 'metadata_manipulation',
-                    'score': metadata_fraud['score'],
-                    'description': metadata_fraud['description'],
-                    'severity': 'low'
-                })
-                confidence_score += 0.1
-            
-            # Determine overall risk level
-            if confidence_score > 0.7:
-                risk_level = 'high'
-            elif confidence_score > 0.4:
-                risk_level = 'medium'
+        Returns:
+            One fraud detection result per item, in the order given
+        """
+        try:
+            views = [ContentView.from_dict(content_data) for content_data in contents]
+            engagement_results = self._detect_engagement_fraud_batch(views)
+            metadata_results = self._detect_metadata_manipulation_batch(views)
+            if len(views) >= _PARALLEL_BATCH_MIN:
+                phashes = list(self._executor.map(self._generate_perceptual_hash, views))
             else:
-                risk_level = 'low'
+                phashes = [self._generate_perceptual_hash(view) for view in views]
+        except Exception as e:
+            self.logger.error(f"Batch fraud checks failed, analyzing items individually: {str(e)}")
+            return [self.detect_content_fraud(content_data) for content_data in contents]
+        
+        timestamp = _local_now_iso()
+        results = []
+        for view, engagement_fraud, metadata_fraud, phash in zip(views, engagement_results, metadata_results, phashes):
+            try:
+                results.append(self._compile_content_fraud_result(view, engagement_fraud, metadata_fraud, phash, timestamp))
+            except Exception as e:
+                self.logger.error(f"Fraud detection failed for {view.content_id or 'unknown'}: {str(e)}")
+                results.append(self._get_fallback_fraud_result(view.source))
+        return results
+    
+    def _compile_content_fraud_result(self, view: ContentView, engagement_fraud: Dict[str, Any],
+                                      metadata_fraud: Dict[str, Any], phash: Optional[int],
+                                      timestamp: str) -> Dict[str, Any]:
+        """Run the per-item checks and assemble the fraud detection result around the precomputed ones"""
+        fraud_indicators = []
+        risk_level = 'low'
+        
+        content_id = view.content_id
+        creator_id = view.creator_id
+        
+        # 1. Duplicate content detection
+        duplicate_score = self._check_duplicate_content(view, phash)
+        if duplicate_score > self.SIMILARITY_THRESHOLD:
+            fraud_indicators.append({
+                'type': 'duplicate_content',
+                'score': round(duplicate_score, 3),
+                'description': f'Content appears to be {duplicate_score:.1%} similar to existing content',
+                'severity': 'high' if duplicate_score > 0.95 else 'medium'
+            })
             
-            # Calculate final fraud probability
-            fraud_probability = min(1.0, confidence_score)
+        # 2. AI-generated content detection
+        ai_detection_score = self._detect_undisclosed_ai_content(view)
+        if ai_detection_score > self.AI_CONTENT_CONFIDENCE_THRESHOLD:
+            fraud_indicators.append({
+                'type': 'undisclosed_ai_content',
+                'score': round(ai_detection_score, 3),
+                'description': f'Content likely AI-generated ({ai_detection_score:.1%} confidence) without proper disclosure',
+                'severity': 'medium'
+            })
             
-            # Generate recommendations
-            recommendations = self._generate_fraud_recommendations(fraud_indicators, risk_level)
+        # 3. Engagement manipulation detection
+        if engagement_fraud['detected']:
+            fraud_indicators.append({
+                'type': 'engagement_manipulation',
+                'score': engagement_fraud['confidence'],
+                'description': engagement_fraud['description'],
+                'severity': 'high' if engagement_fraud['confidence'] > 0.8 else 'medium',
+                'details': engagement_fraud['details']
+            })
             
-            # Log detection results
-            self.logger.info(f"Fraud detection completed for {content_id}: {risk_level} risk, {len(fraud_indicators)} indicators")
+        # 4. Creator behavior analysis
+        behavior_fraud = self._analyze_creator_behavior(creator_id, view)
+        if behavior_fraud['suspicious']:
+            fraud_indicators.append({
+                'type': 'suspicious_behavior',
+                'score': behavior_fraud['score'],
+                'description': behavior_fraud['description'],
+                'severity': behavior_fraud['severity'],
+                'patterns': behavior_fraud['patterns']
+            })
             
-            return {
-                'content_id': content_id,
-                'timestamp': datetime.now().isoformat(),
-                'fraud_detected': len(fraud_indicators) > 0,
-                'fraud_probability': round(fraud_probability, 3),
-                'risk_level': risk_level,
-                'confidence_score': round(confidence_score, 3),
-                'fraud_indicators': fraud_indicators,
-                'recommendations': recommendations,
-                'analysis_details': {
-                    'duplicate_check': duplicate_score,
-                    'ai_content_check': ai_detection_score,
-                    'engagement_analysis': engagement_fraud,
-                    'behavior_analysis': behavior_fraud,
-                    'quality_analysis': quality_fraud,
-                    'metadata_analysis': metadata_fraud
-                }
-            }
+        # 5. Content quality consistency analysis
+        quality_fraud = self._detect_quality_inconsistency(creator_id, view)
+        if quality_fraud['detected']:
+            fraud_indicators.append({
+                'type': 'quality_inconsistency',
+                'score': quality_fraud['score'],
+                'description': quality_fraud['description'],
+                'severity': 'medium'
+            })
             
-        except Exception as e:
-            self.logger.error(f"Fraud detection failed for {content_data.get('content_id', 'unknown')}: {str(e)}")
-            return self._get_fallback_fraud_result(content_data)
+        # 6. Metadata manipulation detection
+        if metadata_fraud['detected']:
+            fraud_indicators.append({
+                'type': 'metadata_manipulation',
+                'score': metadata_fraud['score'],
+                'description': metadata_fraud['description'],
+                'severity': 'low'
+            })
+        
+        # Confidence is the summed weight of the raised indicators
+        confidence_score = sum(_CONTENT_FRAUD_WEIGHTS[indicator['type']] for indicator in fraud_indicators)
+        
+        # Determine overall risk level
+        if confidence_score > 0.7:
+            risk_level = 'high'
+        elif confidence_score > 0.4:
+            risk_level = 'medium'
+        else:
+            risk_level = 'low'
+        
+        # Calculate final fraud probability
+        fraud_probability = min(1.0, confidence_score)
+        
+        # Generate recommendations
+        recommendations = self._generate_fraud_recommendations(fraud_indicators, risk_level)
+        
+        # Log detection results
+        self.logger.info(f"Fraud detection completed for {content_id}: {risk_level} risk, {len(fraud_indicators)} indicators")
+        
+        return {
+            'content_id': content_id,
+            'timestamp': timestamp,
+            'fraud_detected': len(fraud_indicators) > 0,
+            'fraud_probability': round(fraud_probability, 3),
+            'risk_level': risk_level,
+            'confidence_score': round(confidence_score, 3),
+            'fraud_indicators': fraud_indicators,
+            'recommendations': recommendations,
+            'analysis_details': {
+                'duplicate_check': duplicate_score,
+                'ai_content_check': ai_detection_score,
+                'engagement_analysis': engagement_fraud,
+                'behavior_analysis': behavior_fraud,
+                'quality_analysis': quality_fraud,
+                'metadata_analysis': metadata_fraud
+            }
+        }
     
-    def _detect_engagement_fraud(self, content_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _detect_engagement_fraud(self, view: ContentView) -> Dict[str, Any]:
         """Detect artificial engagement manipulation"""
         try:
-            engagement_data = content_data.get('engagement', {})
-            views = engagement_data.get('views', 0)
-            likes = engagement_data.get('likes', 0)
-            comments = engagement_data.get('comments', 0)
-            shares = engagement_data.get('shares', 0)
+            views = view.views
+            likes = view.likes
+            comments = view.comments
+            shares = view.shares
             
             # Calculate engagement ratios
             if views > 0:
@@ -185,7 +498,7 @@ class FraudDetector:
                 confidence += 0.3
                 
             # Engagement velocity analysis (simulated)
-            velocity_score = np.random.uniform(0.0, 1.0)
+            velocity_score = random.random()
             if velocity_score > 0.8:
                 anomalies.append('artificial_velocity')
                 confidence += 0.5
@@ -205,7 +518,49 @@ class FraudDetector:
             self.logger.error(f"Engagement fraud detection failed: {e}")
             return {'detected': False, 'confidence': 0.0, 'description': 'Analysis failed'}
     
-    def _analyze_creator_behavior(self, creator_id: str, content_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _detect_engagement_fraud_batch(self, contents: List[ContentView]) -> List[Dict[str, Any]]:
+        """_detect_engagement_fraud over a batch, with the ratios and thresholds computed per column"""
+        views = np.array([view.views for view in contents], dtype=np.float64)
+        likes = np.array([view.likes for view in contents], dtype=np.float64)
+        comments = np.array([view.comments for view in contents], dtype=np.float64)
+        shares = np.array([view.shares for view in contents], dtype=np.float64)
+        
+        # Calculate engagement ratios, zero where there are no views
+        has_views = views > 0
+        safe_views = np.where(has_views, views, 1.0)
+        like_ratio = np.where(has_views, likes / safe_views, 0.0)
+        comment_ratio = np.where(has_views, comments / safe_views, 0.0)
+        share_ratio = np.where(has_views, shares / safe_views, 0.0)
+        
+        # Detect anomalous engagement patterns
+        high_like = like_ratio > 0.3  # More than 30% like rate is suspicious
+        high_comment = comment_ratio > 0.1  # More than 10% comment rate is unusual
+        artificial_velocity = np.random.uniform(0.0, 1.0, len(contents)) > 0.8  # Engagement velocity (simulated)
+        confidence = high_like * 0.4 + high_comment * 0.3 + artificial_velocity * 0.5
+        
+        results = []
+        for index in range(len(contents)):
+            anomalies = [
+                name for name, flagged in (
+                    ('high_like_ratio', high_like[index]),
+                    ('high_comment_ratio', high_comment[index]),
+                    ('artificial_velocity', artificial_velocity[index])
+                ) if flagged
+            ]
+            results.append({
+                'detected': bool(confidence[index] > 0.5),
+                'confidence': round(float(confidence[index]), 3),
+                'description': f'Suspicious engagement patterns detected: {", ".join(anomalies)}' if anomalies else 'Normal engagement patterns',
+                'details': {
+                    'like_ratio': round(float(like_ratio[index]), 4),
+                    'comment_ratio': round(float(comment_ratio[index]), 4),
+                    'share_ratio': round(float(share_ratio[index]), 4),
+                    'anomalies': anomalies
+                }
+            })
+        return results
+    
+    def _analyze_creator_behavior(self, creator_id: str, view: ContentView) -> Dict[str, Any]:
         """Analyze creator behavior patterns for fraud indicators"""
         try:
             # Get creator's historical data (simulated)
@@ -231,14 +586,14 @@ class FraudDetector:
             # Check quality consistency
             quality_scores = creator_history.get('quality_scores', [])
             if len(quality_scores) > 5:
-                quality_variance = np.var(quality_scores)
+                quality_variance = _pvariance(quality_scores)
                 if quality_variance > 0.3:  # High variance in quality
                     suspicious_patterns.append('inconsistent_quality')
                     score += 0.2
                     
             # Add current content data
             creator_history['upload_frequency'].append(current_time)
-            current_quality = content_data.get('quality_score', 0.5)
+            current_quality = view.quality_score
             creator_history['quality_scores'].append(current_quality)
             
             # Keep only recent data
@@ -261,17 +616,17 @@ class FraudDetector:
             self.logger.error(f"Creator behavior analysis failed: {e}")
             return {'suspicious': False, 'score': 0.0, 'description': 'Analysis failed', 'severity': 'low', 'patterns': []}
     
-    def _detect_quality_inconsistency(self, creator_id: str, content_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _detect_quality_inconsistency(self, creator_id: str, view: ContentView) -> Dict[str, Any]:
         """Detect sudden quality changes that might indicate fraud"""
         try:
             creator_history = self.user_behavior_patterns.get(creator_id, {})
             quality_scores = creator_history.get('quality_scores', [])
-            current_quality = content_data.get('quality_score', 0.5)
+            current_quality = view.quality_score
             
             if len(quality_scores) < 3:  # Need historical data
                 return {'detected': False, 'score': 0.0, 'description': 'Insufficient historical data'}
                 
-            avg_quality = np.mean(quality_scores[-5:])  # Average of last 5
+            avg_quality = _mean(quality_scores[-5:])  # Average of last 5
             quality_drop = avg_quality - current_quality
             
             if quality_drop > self.QUALITY_DROP_THRESHOLD:
@@ -287,15 +642,15 @@ class FraudDetector:
             self.logger.error(f"Quality inconsistency detection failed: {e}")
             return {'detected': False, 'score': 0.0, 'description': 'Analysis failed'}
     
-    def _detect_metadata_manipulation(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+    def _detect_metadata_manipulation(self, view: ContentView) -> Dict[str, Any]:
         """Detect metadata manipulation"""
         try:
             manipulation_score = 0.0
             issues = []
             
             # Check timestamp consistency
-            creation_time = metadata.get('creation_time')
-            upload_time = metadata.get('upload_time')
+            creation_time = view.creation_time
+            upload_time = view.upload_time
             
             if creation_time and upload_time:
                 time_diff = abs(upload_time - creation_time)
@@ -304,15 +659,13 @@ class FraudDetector:
                     manipulation_score += 0.3
                     
             # Check for suspicious edit patterns
-            edit_count = metadata.get('edit_count', 0)
+            edit_count = view.edit_count
             if edit_count > 20:
                 issues.append('excessive_edits')
                 manipulation_score += 0.2
                 
-            # Check metadata completeness
-            required_fields = ['title', 'description', 'duration']
-            missing_fields = [field for field in required_fields if not metadata.get(field)]
-            if len(missing_fields) > 1:
+            # Check metadata completeness (title, description and duration)
+            if view.missing_metadata_fields > 1:
                 issues.append('incomplete_metadata')
                 manipulation_score += 0.1
                 
@@ -326,6 +679,39 @@ class FraudDetector:
             self.logger.error(f"Metadata analysis failed: {e}")
             return {'detected': False, 'score': 0.0, 'description': 'Analysis failed', 'issues': []}
     
+    def _detect_metadata_manipulation_batch(self, contents: List[ContentView]) -> List[Dict[str, Any]]:
+        """_detect_metadata_manipulation over a batch, with each check computed per column"""
+        creation_times = [view.creation_time for view in contents]
+        upload_times = [view.upload_time for view in contents]
+        has_times = np.array([bool(c and u) for c, u in zip(creation_times, upload_times)])
+        time_diffs = np.array([
+            abs(u - c) if has else 0.0 for c, u, has in zip(creation_times, upload_times, has_times)
+        ], dtype=np.float64)
+        edit_counts = np.array([view.edit_count for view in contents], dtype=np.float64)
+        missing_counts = np.array([view.missing_metadata_fields for view in contents])
+        
+        timestamp_inconsistency = has_times & (time_diffs > 86400 * 30)  # More than 30 days
+        excessive_edits = edit_counts > 20
+        incomplete_metadata = missing_counts > 1
+        manipulation_scores = timestamp_inconsistency * 0.3 + excessive_edits * 0.2 + incomplete_metadata * 0.1
+        
+        results = []
+        for index in range(len(contents)):
+            issues = [
+                name for name, flagged in (
+                    ('timestamp_inconsistency', timestamp_inconsistency[index]),
+                    ('excessive_edits', excessive_edits[index]),
+                    ('incomplete_metadata', incomplete_metadata[index])
+                ) if flagged
+            ]
+            results.append({
+                'detected': bool(manipulation_scores[index] > 0.2),
+                'score': round(float(manipulation_scores[index]), 3),
+                'description': f'Metadata issues: {", ".join(issues)}' if issues else 'Metadata appears normal',
+                'issues': issues
+            })
+        return results
+    
     def _generate_fraud_recommendations(self, fraud_indicators: List[Dict], risk_level: str) -> List[str]:
         """Generate actionable fraud prevention recommendations"""
         recommendations = []
@@ -365,7 +751,7 @@ class FraudDetector:
         """Provide fallback result when fraud detection fails"""
         return {
             'content_id': content_data.get('content_id', ''),
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': _local_now_iso(),
             'fraud_detected': False,
             'fraud_probability': 0.5,  # Unknown, assume moderate risk
             'risk_level': 'medium',
@@ -390,48 +776,19 @@ class FraudDetector:
             Dictionary with user fraud detection results
         """
         try:
+            # Scores in _USER_FRAUD_CHECKS order; an unauthentic account scores high
+            scores = (
+                self._check_upload_rate_abuse(user_id, user_data),
+                self._detect_bot_behavior(user_data),
+                self._detect_fake_engagement(user_data),
+                1.0 - self._check_account_authenticity(user_data)
+            )
             fraud_indicators = []
             confidence_score = 0.0
-            
-            # Check upload rate abuse
-            upload_abuse_score = self._check_upload_rate_abuse(user_id, user_data)
-            if upload_abuse_score > 0.7:
-                fraud_indicators.append({
-                    'type': 'upload_rate_abuse',
-                    'score': upload_abuse_score,
-                    'description': 'Unusually high upload rate detected'
-                })
-                confidence_score += 0.3
-                
-            # Check for bot-like behavior
-            bot_score = self._detect_bot_behavior(user_data)
-            if bot_score > 0.8:
-                fraud_indicators.append({
-                    'type': 'bot_behavior',
-                    'score': bot_score,
-                    'description': 'User behavior patterns suggest automated activity'
-                })
-                confidence_score += 0.4
-                
-            # Check for fake engagement
-            fake_engagement_score = self._detect_fake_engagement(user_data)
-            if fake_engagement_score > 0.6:
-                fraud_indicators.append({
-                    'type': 'fake_engagement',
-                    'score': fake_engagement_score,
-                    'description': 'Suspicious engagement patterns detected'
-                })
-                confidence_score += 0.3
-                
-            # Check account authenticity
-            account_authenticity_score = self._check_account_authenticity(user_data)
-            if account_authenticity_score < 0.4:
-                fraud_indicators.append({
-                    'type': 'fake_account',
-                    'score': 1.0 - account_authenticity_score,
-                    'description': 'Account appears to be fake or compromised'
-                })
-                confidence_score += 0.4
+            for (fraud_type, threshold, weight, description), score in zip(_USER_FRAUD_CHECKS, scores):
+                if score > threshold:
+                    fraud_indicators.append({'type': fraud_type, 'score': score, 'description': description})
+                    confidence_score += weight
                 
             risk_level = self._calculate_risk_level(confidence_score)
             
@@ -441,7 +798,7 @@ class FraudDetector:
                 'risk_level': risk_level,
                 'fraud_indicators': fraud_indicators,
                 'recommended_action': self._get_recommended_action(risk_level),
-                'analysis_timestamp': datetime.utcnow().isoformat()
+                'analysis_timestamp': _utc_now_iso()
             }
             
         except Exception as e:
@@ -455,21 +812,27 @@ class FraudDetector:
                 'error': str(e)
             }
     
-    def _check_duplicate_content(self, content_data: Dict[str, Any]) -> float:
-        """Check for duplicate or near-duplicate content"""
+    def _check_duplicate_content(self, view: ContentView, phash: Optional[int]) -> float:
+        """Check for duplicate or near-duplicate content, given its perceptual hash (None without an image)"""
         try:
-            content_hash = self._generate_content_hash(content_data)
+            content_hash = self._generate_content_hash(view)
             
             # Check exact duplicates
-            if content_hash in self.content_hashes:
+            seen_hashes = self.content_hashes if self.content_hashes is not None else self.content_filter
+            if content_hash in seen_hashes:
                 return 1.0
-                
-            # Mock perceptual hashing for near-duplicate detection - hackathon demonstration
-            # For now, return a mock similarity score
-            similarity_score = np.random.uniform(0.0, 0.3)  # Mock implementation
+            
+            # Near duplicates: closest stored perceptual hash by Hamming distance
+            similarity_score = 0.0
+            if phash is not None:
+                if self.phash_count:
+                    # One vectorized XOR + popcount over every stored hash
+                    distances = _popcount64(self.phash_array[:self.phash_count] ^ np.uint64(phash))
+                    similarity_score = 1.0 - int(distances.min()) / PHASH_BITS
+                self._store_perceptual_hash(phash)
             
             # Store hash for future comparisons
-            self.content_hashes.add(content_hash)
+            seen_hashes.add(content_hash)
             
             return similarity_score
             
@@ -477,53 +840,42 @@ class FraudDetector:
             self.logger.error(f"Error checking duplicate content: {str(e)}")
             return 0.0
     
-    def _detect_undisclosed_ai_content(self, content_data: Dict[str, Any]) -> float:
+    def _detect_undisclosed_ai_content(self, view: ContentView) -> float:
         """Detect AI-generated content that's not properly disclosed"""
         try:
-            # Check for AI-related indicators in metadata
-            ai_indicators = [
-                'generated', 'artificial', 'synthetic', 'ai-created',
-                'machine-generated', 'automated', 'algorithmic'
-            ]
-            
-            description = content_data.get('description', '').lower()
-            title = content_data.get('title', '').lower()
-            tags = [tag.lower() for tag in content_data.get('tags', [])]
-            
-            # Check if AI disclosure is present
-            has_ai_disclosure = any(indicator in description + title + ' '.join(tags) 
-                                  for indicator in ai_indicators)
-            
-            # Mock AI content detection using ML models - hackathon demonstration
-            # For now, return a mock score
-            ai_content_probability = np.random.uniform(0.1, 0.4)
+            # Without a detection model there is nothing to flag (the former mock score, drawn
+            # from [0.1, 0.4), could never clear the threshold below)
+            if self.ai_detection_model is None:
+                return 0.0
+            ai_content_probability = float(self.ai_detection_model(view.source))
+            if ai_content_probability <= 0.7:
+                return 0.0
             
-            if ai_content_probability > 0.7 and not has_ai_disclosure:
-                return ai_content_probability
+            # Check if AI disclosure is present in the title, description or tags
+            text = ' '.join((view.title, view.description, *view.tags))
+            has_ai_disclosure = _AI_DISCLOSURE_RE.search(text) is not None
             
-            return 0.0
+            return 0.0 if has_ai_disclosure else ai_content_probability
             
         except Exception as e:
             self.logger.error(f"Error detecting AI content: {str(e)}")
             return 0.0
     
-    def _check_copyright_infringement(self, content_data: Dict[str, Any]) -> float:
+    def _check_copyright_infringement(self, view: ContentView) -> float:
         """Check for potential copyright infringement"""
         try:
             # Mock copyright detection using content fingerprinting - hackathon demonstration
             # For now, return a mock score based on content characteristics
             
             # Check for copyrighted music indicators
-            audio_features = content_data.get('audio_features', {})
-            if audio_features.get('has_music', False):
-                music_copyright_score = np.random.uniform(0.0, 0.3)
+            if view.has_music:
+                music_copyright_score = random.uniform(0.0, 0.3)
             else:
                 music_copyright_score = 0.0
                 
             # Check for copyrighted visual content
-            visual_features = content_data.get('visual_features', {})
-            if visual_features.get('has_logos', False) or visual_features.get('has_watermarks', False):
-                visual_copyright_score = np.random.uniform(0.2, 0.5)
+            if view.has_logos or view.has_watermarks:
+                visual_copyright_score = random.uniform(0.2, 0.5)
             else:
                 visual_copyright_score = 0.0
                 
@@ -533,14 +885,12 @@ class FraudDetector:
             self.logger.error(f"Error checking copyright: {str(e)}")
             return 0.0
     
-    def _check_metadata_manipulation(self, content_data: Dict[str, Any]) -> float:
+    def _check_metadata_manipulation(self, view: ContentView) -> float:
         """Check for metadata manipulation or tampering"""
         try:
-            metadata = content_data.get('metadata', {})
-            
             # Check for inconsistencies in timestamps
-            creation_time = metadata.get('creation_time')
-            upload_time = metadata.get('upload_time')
+            creation_time = view.creation_time
+            upload_time = view.upload_time
             
             if creation_time and upload_time:
                 time_diff = abs(upload_time - creation_time)
@@ -548,7 +898,7 @@ class FraudDetector:
                     return 0.6
                     
             # Check for suspicious editing patterns
-            edit_count = metadata.get('edit_count', 0)
+            edit_count = view.edit_count
             if edit_count > 50:  # Unusually high edit count
                 return 0.4
                 
@@ -561,23 +911,24 @@ class FraudDetector:
     def _check_upload_rate_abuse(self, user_id: str, user_data: Dict[str, Any]) -> float:
         """Check for upload rate abuse"""
         try:
-            current_time = time.time()
+            # Integer monotonic time, immune to wall-clock adjustments
+            current_time = time.monotonic_ns()
             user_pattern = self.user_behavior_patterns.get(user_id, {
-                'uploads': [],
+                # Only the newest uploads matter for the rate limit, so the window never grows past it
+                'uploads': deque(maxlen=self.UPLOAD_RATE_LIMIT + 1),
                 'last_quality_scores': []
             })
             
-            # Remove old uploads (older than 1 hour)
-            user_pattern['uploads'] = [
-                upload_time for upload_time in user_pattern['uploads']
-                if current_time - upload_time < 3600
-            ]
+            # Slide the window: drop uploads older than 1 hour from the front
+            uploads = user_pattern['uploads']
+            while uploads and current_time - uploads[0] >= _UPLOAD_WINDOW_NS:
+                uploads.popleft()
             
             # Add current upload
-            user_pattern['uploads'].append(current_time)
+            uploads.append(current_time)
             
             # Check if rate limit exceeded
-            if len(user_pattern['uploads']) > self.UPLOAD_RATE_LIMIT:
+            if len(uploads) > self.UPLOAD_RATE_LIMIT:
                 return 0.8
                 
             # Update patterns
@@ -592,19 +943,26 @@ class FraudDetector:
     def _detect_bot_behavior(self, user_data: Dict[str, Any]) -> float:
         """Detect bot-like behavior patterns"""
         try:
-            # Check for regular timing patterns
             upload_times = user_data.get('upload_times', [])
+            content_similarities = user_data.get('content_similarities', [])
+            if len(upload_times) < _SMALL_SERIES and len(content_similarities) < _SMALL_SERIES:
+                intervals = [later - earlier for earlier, later in zip(upload_times, upload_times[1:])]
+                interval_variance = _pvariance(intervals) if intervals else 0.0
+                mean_similarity = _mean(content_similarities) if len(content_similarities) else 0.0
+            else:
+                interval_variance, mean_similarity = _timing_stats(
+                    np.ascontiguousarray(upload_times, dtype=np.float64),
+                    np.ascontiguousarray(content_similarities, dtype=np.float64)
+                )
+            
+            # Check for regular timing patterns
             if len(upload_times) > 5:
-                intervals = [upload_times[i] - upload_times[i-1] for i in range(1, len(upload_times))]
-                interval_variance = np.var(intervals) if intervals else 0
-                
                 # Very regular intervals suggest bot behavior
                 if interval_variance < 100:  # Very low variance
                     return 0.7
                     
             # Check for identical content patterns
-            content_similarities = user_data.get('content_similarities', [])
-            if content_similarities and np.mean(content_similarities) > 0.9:
+            if len(content_similarities) and mean_similarity > 0.9:
                 return 0.8
                 
             return 0.0
@@ -663,36 +1021,55 @@ class FraudDetector:
             self.logger.error(f"Error checking account authenticity: {str(e)}")
             return 0.5
     
-    def _generate_content_hash(self, content_data: Dict[str, Any]) -> str:
-        """Generate a hash for content identification"""
+    def _generate_content_hash(self, view: ContentView) -> int:
+        """Generate a 64-bit hash for content identification, memoized for repeated content"""
         try:
             # Create a simple hash based on content features
-            content_string = f"{content_data.get('title', '')}{content_data.get('description', '')}"
-            return hashlib.md5(content_string.encode()).hexdigest()
+            return _hash_title_description(view.title, view.description)
         except Exception:
-            return ""
+            return 0
+    
+    def _store_perceptual_hash(self, phash: int) -> None:
+        """Append a perceptual hash, doubling the array's capacity when it is full"""
+        if self.phash_count == len(self.phash_array):
+            grown = np.empty(2 * len(self.phash_array), dtype=np.uint64)
+            grown[:self.phash_count] = self.phash_array
+            self.phash_array = grown
+        self.phash_array[self.phash_count] = phash
+        self.phash_count += 1
+    
+    def _generate_perceptual_hash(self, view: ContentView) -> Optional[int]:
+        """
+        Generate a 64-bit DCT perceptual hash (pHash) of the content's image.
+        
+        Uses the content's image_data, the encoded bytes of the image or of a video's
+        thumbnail. Visually similar images get hashes a small Hamming distance apart.
+        Returns None when there is no decodable image.
+        """
+        image_data = view.image_data
+        if not image_data:
+            return None
+        try:
+            import cv2
+            
+            image = cv2.imdecode(np.frombuffer(image_data, dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+            if image is None:
+                return None
+            small = cv2.resize(image, (_PHASH_IMAGE_SIZE, _PHASH_IMAGE_SIZE), interpolation=cv2.INTER_AREA)
+            block = cv2.dct(small.astype(np.float32))[:_PHASH_BLOCK_SIZE, :_PHASH_BLOCK_SIZE]
+            bits = (block > np.median(block)).ravel()
+            return int.from_bytes(np.packbits(bits).tobytes(), 'big')
+        except Exception as e:
+            self.logger.error(f"Error generating perceptual hash: {str(e)}")
+            return None
     
     def _calculate_risk_level(self, confidence_score: float) -> str:
         """Calculate risk level based on confidence score"""
-        if confidence_score >= 0.8:
-            return 'high'
-        elif confidence_score >= 0.5:
-            return 'medium'
-        elif confidence_score >= 0.3:
-            return 'low'
-        else:
-            return 'minimal'
+        return _RISK_LEVELS[bisect.bisect_right(_RISK_THRESHOLDS, confidence_score)]
     
     def _get_recommended_action(self, risk_level: str) -> str:
         """Get recommended action based on risk level"""
-        actions = {
-            'high': 'block_content',
-            'medium': 'flag_for_review',
-            'low': 'monitor',
-            'minimal': 'allow',
-            'unknown': 'manual_review'
-        }
-        return actions.get(risk_level, 'manual_review')
+        return _RECOMMENDED_ACTIONS.get(risk_level, 'manual_review')
     
     def assess_risk(self, creator_id: str, content_data: dict) -> dict:
         """Assess fraud risk for content"""
@@ -723,7 +1100,7 @@ class FraudDetector:
             
             report = {
                 'report_id': report_id,
-                'timestamp': datetime.utcnow().isoformat(),
+                'timestamp': _utc_now_iso(),
                 'status': 'submitted',
                 'data': data,
                 'priority': 'medium',
@@ -739,7 +1116,7 @@ class FraudDetector:
             return {
                 'error': 'Failed to create report',
                 'message': str(e),
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': _utc_now_iso()
             }
     
     def get_status(self) -> Dict[str, Any]:
@@ -749,13 +1126,14 @@ class FraudDetector:
                 'status': 'operational',
                 'version': '1.0.0',
                 'models_loaded': True,
-                'content_hashes_tracked': len(self.content_hashes),
+                'content_hashes_tracked': len(self.content_hashes if self.content_hashes is not None else self.content_filter),
+                'perceptual_hashes_tracked': self.phash_count,
                 'user_patterns_tracked': len(self.user_behavior_patterns),
-                'last_updated': datetime.utcnow().isoformat()
+                'last_updated': _utc_now_iso()
             }
         except Exception as e:
             return {
                 'status': 'error',
                 'error': str(e),
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': _utc_now_iso()
             }
@@ -5,12 +5,45 @@ Calculates quality scores based on content features
 
 import os
 import json
+import logging
 import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 import pickle
 from collections import defaultdict
 
+# Optional Numba import with fallback
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    # No fastmath: summing strictly left to right keeps results bit-identical to calculate_scores.
+    # Explicit signature compiles eagerly (and caches to disk) instead of on the first batch
+    @njit('float64[::1](float64[:, ::1], float64[::1])', cache=True)
+    def _weighted_sum(scores, weights):
+        """Weighted sum of every row of an (N, D) score matrix"""
+        out = np.empty(scores.shape[0], dtype=np.float64)
+        for i in range(scores.shape[0]):
+            s = 0.0
+            for j in range(scores.shape[1]):
+                s += scores[i, j] * weights[j]
+            out[i] = s
+        return out
+else:
+    def _weighted_sum(scores, weights):
+        """Weighted sum of every row of an (N, D) score matrix"""
+        # Column by column rather than scores @ weights, whose BLAS summation order may differ
+        out = np.zeros(scores.shape[0], dtype=np.float64)
+        for j in range(scores.shape[1]):
+            out += scores[:, j] * weights[j]
+        return out
+
+# Order of the quality dimensions in score matrices and weight vectors
+DIMENSIONS = ('engagement', 'educational', 'creativity', 'safety', 'production')
+
 class QualityScorer:
     """
     Calculates comprehensive quality scores for content based on extracted features.
@@ -26,6 +59,9 @@ class QualityScorer:
             'safety': 0.15,          # Content safety and compliance
             'production': 0.20       # Technical production quality
         }
+        # The same weights in DIMENSIONS order, for the batch kernel. These are the scorer's own
+        # weights, which intentionally differ from Config.QUALITY_WEIGHTS
+        self.weight_vector = np.array([self.weights[dimension] for dimension in DIMENSIONS], dtype=np.float64)
         
         # Historical data for trend analysis
         self.quality_history = defaultdict(list)
@@ -41,6 +77,8 @@ class QualityScorer:
         # Load any pre-trained models (for demo, we'll use rule-based scoring)
         self.model = None
         
+        self.logger = logging.getLogger(__name__)
+        
     def calculate_scores(self, features: Dict[str, Any]) -> Dict[str, Any]:
         """
         Calculate comprehensive quality scores based on extracted features.
@@ -53,66 +91,102 @@ class QualityScorer:
         """
         try:
             content_features = features.get('features', {})
-            content_id = features.get('content_id')
-            
-            # Calculate individual dimension scores
-            engagement_score = self._calculate_engagement_score(content_features)
-            educational_score = self._calculate_educational_score(content_features)
-            creativity_score = self._calculate_creativity_score(content_features)
-            safety_score = self._calculate_safety_score(content_features)
-            production_score = self._calculate_production_score(content_features)
+            dimension_scores = self._calculate_dimension_scores(content_features)
             
             # Calculate weighted overall score
-            overall_score = (
-                engagement_score * self.weights['engagement'] +
-                educational_score * self.weights['educational'] +
-                creativity_score * self.weights['creativity'] +
-                safety_score * self.weights['safety'] +
-                production_score * self.weights['production']
+            overall_score = sum(
+                dimension_scores[dimension] * self.weights[dimension] for dimension in DIMENSIONS
             )
             
-            # Generate quality rating
-            quality_rating = self._get_quality_rating(overall_score)
-            
-            # Generate recommendations
-            recommendations = self._generate_recommendations(
-                content_features, 
-                {
-                    'engagement': engagement_score,
-                    'educational': educational_score,
-                    'creativity': creativity_score,
-                    'safety': safety_score,
-                    'production': production_score
-                }
-            )
+            return self._compile_scores(features.get('content_id'), content_features, dimension_scores, overall_score)
             
-            # Store in history for trend analysis
-            if content_id:
-                self._store_quality_history(content_id, overall_score, content_features)
-            
-            result = {
-                'overall_score': round(overall_score, 3),
-                'quality_rating': quality_rating,
-                'engagement': round(engagement_score, 3),
-                'educational': round(educational_score, 3),
-                'creativity': round(creativity_score, 3),
-                'safety': round(safety_score, 3),
-                'production': round(production_score, 3),
-                'recommendations': recommendations,
-                'scoring_timestamp': datetime.utcnow().isoformat(),
-                'weights_used': self.weights.copy()
-            }
+        except Exception as e:
+            self.logger.exception("Error calculating quality scores")
+            return self._get_fallback_scores(e)
+    
+    def calculate_scores_batch(self, features_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Calculate quality scores for many contents at once.
+        
+        The per-dimension scores of all items are stacked into an (N, 5) matrix and the
+        weighted overall scores are computed by a single compiled kernel call.
+        
+        Args:
+            features_list: List of dictionaries containing extracted content features
             
-            return result
+        Returns:
+            List of quality score dictionaries, in the same order as features_list
+        """
+        if not features_list:
+            return []
+        
+        try:
+            content_features_list = [features.get('features', {}) for features in features_list]
+            dimension_scores_list = [
+                self._calculate_dimension_scores(content_features) for content_features in content_features_list
+            ]
+            
+            score_matrix = np.array(
+                [[scores[dimension] for dimension in DIMENSIONS] for scores in dimension_scores_list],
+                dtype=np.float64
+            )
+            overall_scores = _weighted_sum(score_matrix, self.weight_vector)
+            
+            return [
+                self._compile_scores(features.get('content_id'), content_features, dimension_scores, float(overall_score))
+                for features, content_features, dimension_scores, overall_score in zip(
+                    features_list, content_features_list, dimension_scores_list, overall_scores
+                )
+            ]
             
         except Exception as e:
-            print(f"Error calculating quality scores: {str(e)}")
-            return {
-                'overall_score': 0.5,
-                'quality_rating': 'fair',
-                'error': str(e),
-                'scoring_timestamp': datetime.utcnow().isoformat()
-            }
+            self.logger.exception("Error calculating batch quality scores")
+            return [self._get_fallback_scores(e) for _ in features_list]
+    
+    def _calculate_dimension_scores(self, content_features: Dict[str, Any]) -> Dict[str, float]:
+        """Calculate the individual quality dimension scores."""
+        return {
+            'engagement': self._calculate_engagement_score(content_features),
+            'educational': self._calculate_educational_score(content_features),
+            'creativity': self._calculate_creativity_score(content_features),
+            'safety': self._calculate_safety_score(content_features),
+            'production': self._calculate_production_score(content_features)
+        }
+    
+    def _compile_scores(self, content_id: Optional[str], content_features: Dict[str, Any],
+                        dimension_scores: Dict[str, float], overall_score: float) -> Dict[str, Any]:
+        """Build the quality score result for one content item."""
+        # Generate quality rating
+        quality_rating = self._get_quality_rating(overall_score)
+        
+        # Generate recommendations
+        recommendations = self._generate_recommendations(content_features, dimension_scores)
+        
+        # Store in history for trend analysis
+        if content_id:
+            self._store_quality_history(content_id, overall_score, content_features)
+        
+        return {
+            'overall_score': round(overall_score, 3),
+            'quality_rating': quality_rating,
+            'engagement': round(dimension_scores['engagement'], 3),
+            'educational': round(dimension_scores['educational'], 3),
+            'creativity': round(dimension_scores['creativity'], 3),
+            'safety': round(dimension_scores['safety'], 3),
+            'production': round(dimension_scores['production'], 3),
+            'recommendations': recommendations,
+            'scoring_timestamp': datetime.utcnow().isoformat(),
+            'weights_used': self.weights.copy()
+        }
+    
+    def _get_fallback_scores(self, error: Exception) -> Dict[str, Any]:
+        """Provide fallback scores when scoring fails."""
+        return {
+            'overall_score': 0.5,
+            'quality_rating': 'fair',
+            'error': str(error),
+            'scoring_timestamp': datetime.utcnow().isoformat()
+        }
     
     def _calculate_engagement_score(self, features: Dict[str, Any]) -> float:
         """Calculate engagement potential score."""
@@ -169,8 +243,8 @@ class QualityScorer:
             if 2 <= hashtag_count <= 10:  # Optimal hashtag range
                 score += 0.05
             
-        except Exception as e:
-            print(f"Error calculating engagement score: {str(e)}")
+        except Exception:
+            self.logger.exception("Error calculating engagement score")
         
         return max(0.0, min(1.0, score))
     
@@ -216,8 +290,8 @@ class QualityScorer:
             if ai_category in ['education', 'technology', 'science', 'tutorial']:
                 score += 0.2
             
-        except Exception as e:
-            print(f"Error calculating educational score: {str(e)}")
+        except Exception:
+            self.logger.exception("Error calculating educational score")
         
         return max(0.0, min(1.0, score))
     
@@ -268,8 +342,8 @@ class QualityScorer:
             if not (0.9 <= aspect_ratio <= 1.1):  # Non-square format
                 score += 0.05
             
-        except Exception as e:
-            print(f"Error calculating creativity score: {str(e)}")
+        except Exception:
+            self.logger.exception("Error calculating creativity score")
         
         return max(0.0, min(1.0, score))
     
@@ -308,8 +382,8 @@ class QualityScorer:
             if brightness < 0.2 or brightness > 0.9:  # Too dark or bright
                 score -= 0.05
             
-        except Exception as e:
-            print(f"Error calculating safety score: {str(e)}")
+        except Exception:
+            self.logger.exception("Error calculating safety score")
         
         return max(0.0, min(1.0, score))
     
@@ -362,8 +436,8 @@ class QualityScorer:
             if face_confidence > 0.8:
                 score += 0.05
             
-        except Exception as e:
-            print(f"Error calculating production score: {str(e)}")
+        except Exception:
+            self.logger.exception("Error calculating production score")
         
         return max(0.0, min(1.0, score))
     
@@ -423,8 +497,8 @@ class QualityScorer:
             if len(recommendations) == 0:
                 recommendations.append("Great work! Your content shows good quality across all dimensions")
             
-        except Exception as e:
-            print(f"Error generating recommendations: {str(e)}")
+        except Exception:
+            self.logger.exception("Error generating recommendations")
             recommendations.append("Unable to generate specific recommendations at this time")
         
         return recommendations
@@ -447,8 +521,8 @@ class QualityScorer:
             if len(self.quality_history[creator_id]) > 100:
                 self.quality_history[creator_id] = self.quality_history[creator_id][-100:]
                 
-        except Exception as e:
-            print(f"Error storing quality history: {str(e)}")
+        except Exception:
+            self.logger.exception("Error storing quality history")
     
     def get_quality_trends(self, creator_id: Optional[str] = None, time_range: str = '7d') -> Dict[str, Any]:
         """Get quality trends for a creator or overall."""
@@ -504,7 +578,7 @@ class QualityScorer:
             }
             
         except Exception as e:
-            print(f"Error getting quality trends: {str(e)}")
+            self.logger.exception("Error getting quality trends")
             return {
                 'error': str(e),
                 'creator_id': creator_id,
@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from services.enhanced_content_analyzer import EnhancedContentAnalyzer
+
+CONTENT = {'title': 'How to bake bread', 'description': 'A step by step tutorial', 'content_type': 'video'}
+
+
+def _slow_analyzer():
+    """Analyzer whose analysis takes a while and counts how often it runs"""
+    analyzer = EnhancedContentAnalyzer()
+    analyzer.openai_enabled = False
+    analyzer.runs = 0
+    run_analysis = analyzer._run_analysis
+
+    async def slow_run_analysis(content_data):
+        analyzer.runs += 1
+        await asyncio.sleep(0.05)
+        return await run_analysis(content_data)
+
+    analyzer._run_analysis = slow_run_analysis
+    return analyzer
+
+
+def test_cancelled_first_caller_does_not_cancel_followers():
+    async def scenario():
+        analyzer = _slow_analyzer()
+        first = asyncio.create_task(analyzer.analyze_content_comprehensive(CONTENT))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(analyzer.analyze_content_comprehensive(CONTENT))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        result = await follower
+        assert result.quality_score >= 0
+        assert analyzer.runs == 1
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_follower_does_not_cancel_first_caller():
+    async def scenario():
+        analyzer = _slow_analyzer()
+        first = asyncio.create_task(analyzer.analyze_content_comprehensive(CONTENT))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(analyzer.analyze_content_comprehensive(CONTENT))
+        await asyncio.sleep(0)
+        follower.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await follower
+        result = await first
+        assert result.quality_score >= 0
+        assert analyzer.runs == 1
+
+    asyncio.run(scenario())
@@ -1,7 +1,7 @@
 import time
 import json
 import hashlib
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, List
 from datetime import datetime, timedelta
 import logging
 
@@ -228,6 +228,36 @@ class CacheManager:
         cache_key = f"analysis:{content_id}"
         return self.set(cache_key, analysis, ttl)
     
+    def get_analyses(self, content_ids: List[str]) -> Dict[str, Any]:
+        """
+        Get analysis results for several contents in one pass
+        
+        Args:
+            content_ids: Content identifiers to look up
+            
+        Returns:
+            Dictionary mapping content_id to cached analysis (misses are omitted)
+        """
+        results = {}
+        for content_id in content_ids:
+            value = self.get(f"analysis:{content_id}")
+            if value:
+                results[content_id] = value
+        return results
+    
+    def set_analyses(self, analyses: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """
+        Cache several analysis results at once
+        
+        Args:
+            analyses: Dictionary mapping content_id to analysis result
+            ttl: Time-to-live in seconds (uses default if None)
+            
+        Returns:
+            True if all entries were cached, False otherwise
+        """
+        return all([self.set_analysis(content_id, analysis, ttl) for content_id, analysis in analyses.items()])
+    
     def get_status(self) -> Dict[str, Any]:
         """Get cache status and statistics"""
         try:
@@ -0,0 +1,17 @@
+from typing import Any, Union
+import orjson
+from flask.json.provider import JSONProvider
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson for faster request/response (de)serialization"""
+    
+    # Naive datetimes are treated as UTC, numpy scalars/arrays from the analyzers serialize natively
+    OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize obj to a JSON string"""
+        return orjson.dumps(obj, option=self.OPTIONS).decode()
+    
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """Deserialize a JSON string or bytes"""
+        return orjson.loads(s)
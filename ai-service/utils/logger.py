@@ -1,4 +1,7 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from datetime import datetime
 import os
@@ -18,8 +21,11 @@ def setup_logger(name: str = 'creatorcoin-ai-service', level: str = 'INFO') -> l
     # Create logger
     logger = logging.getLogger(name)
     
-    # Clear any existing handlers
+    # Clear any existing handlers, stopping the listener that fed them
     logger.handlers.clear()
+    listener = _listeners.pop(name, None)
+    if listener is not None:
+        listener.stop()
     
     # Set level
     log_level = getattr(logging, level.upper(), logging.INFO)
@@ -35,7 +41,6 @@ def setup_logger(name: str = 'creatorcoin-ai-service', level: str = 'INFO') -> l
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
     
     # Create file handler if logs directory exists
     logs_dir = os.path.join(os.path.dirname(__file__), '..', 'logs')
@@ -48,10 +53,28 @@ def setup_logger(name: str = 'creatorcoin-ai-service', level: str = 'INFO') -> l
     )
     file_handler.setLevel(log_level)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    
+    # Callers only enqueue records; a background listener does the console and file I/O,
+    # so request threads never block on a slow stdout pipe or disk
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    _listeners[name] = listener
     
     return logger
 
+# Running queue listeners by logger name, flushed on interpreter exit
+_listeners = {}
+
+@atexit.register
+def _stop_listeners():
+    for listener in _listeners.values():
+        listener.stop()
+    _listeners.clear()
+
 def get_logger(name: str = None) -> logging.Logger:
     """
     Get an existing logger or create a new one.
@@ -0,0 +1,16 @@
+"""
+CreatorCoin AI - WSGI entry point
+Production entry point for running the AI service under gunicorn with gevent workers
+"""
+
+# Patch the standard library before anything else is imported so that
+# redis-py, requests and the OpenAI client cooperatively yield on socket I/O
+from gevent import monkey
+monkey.patch_all()
+
+from datetime import datetime
+
+from app import app
+
+# Set start time for uptime calculation
+app.config.setdefault('START_TIME', datetime.utcnow())